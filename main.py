@@ -8,7 +8,8 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from spanish_bank_extractor.gui.app import main
-
 if __name__ == "__main__":
+    # Imported here so the spawned worker processes, which re-import this
+    # script, do not load the GUI and PyQt6.
+    from spanish_bank_extractor.gui.app import main
     main() 
\ No newline at end of file
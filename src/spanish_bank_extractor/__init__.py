@@ -10,11 +10,12 @@ __author__ = "Spanish Bank Extractor Team"
 __description__ = "Extract phone numbers from Spanish bank IBAN data"
 
 from .core.extractor import SpanishBankExtractor
-from .core.bank_registry import BankRegistry
+from .core.bank_registry import BankRegistry, BankInfo
 
 __all__ = [
     "SpanishBankExtractor",
     "BankRegistry",
+    "BankInfo",
     "__version__",
     "__author__",
     "__description__"
@@ -3,6 +3,6 @@ Core functionality for Spanish Bank Phone Extractor.
 """
 
 from .extractor import SpanishBankExtractor
-from .bank_registry import BankRegistry
+from .bank_registry import BankRegistry, BankInfo
 
-__all__ = ["SpanishBankExtractor", "BankRegistry"] 
\ No newline at end of file
+__all__ = ["SpanishBankExtractor", "BankRegistry", "BankInfo"] 
\ No newline at end of file
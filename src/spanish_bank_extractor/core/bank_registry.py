@@ -5,14 +5,87 @@ Handles loading and managing Spanish bank information from the official registry
 """
 
 import csv
+import hashlib
 import os
-from typing import Dict, List, Optional, Tuple
+import pickle
+import sys
+import tempfile
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
 
+# Bump whenever the structure of the cached bank data changes.
+_CACHE_VERSION = 3
+
+# Separates the bank names in the search blob; never part of a name.
+_NAME_SEPARATOR = '\x00'
+
+
+def _cache_path(csv_file: str) -> Path:
+    """
+    Return the path of the parsed-data cache of a bank CSV file.
+    
+    Caches live in the per-user cache directory, named after a hash of the
+    absolute CSV path, so nothing is written next to the CSV file itself.
+    
+    Args:
+        csv_file: Path to the CSV file containing bank data.
+        
+    Returns:
+        Path of the cache file.
+    """
+    if sys.platform == 'win32':
+        cache_root = Path(os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local')
+    elif sys.platform == 'darwin':
+        cache_root = Path.home() / 'Library' / 'Caches'
+    else:
+        cache_root = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    
+    digest = hashlib.sha1(os.path.abspath(csv_file).encode('utf-8')).hexdigest()[:16]
+    return cache_root / 'spanish_bank_extractor' / f"{Path(csv_file).stem}-{digest}.pkl"
+
+
+class BankInfo(NamedTuple):
+    """Information about a single bank of the registry."""
+    
+    name: str
+    iban_prefix: str
+    address: str
+    entity_code: str
+    lei: str
+    operator: str
+    provider: str
+    supervisor_code: str
+
+
 class BankRegistry:
     """Manages Spanish bank information and provides search functionality."""
     
+    __slots__ = (
+        'csv_file', 'cache_file', 'banks', '_entity_code_by_prefix', '_prefix_by_entity_code',
+        '_entity_codes', '_prefixes', '_names', '_name_offsets', '_lower_names'
+    )
+    
+    # Major Spanish banks offered for quick selection, as parallel tuples of
+    # IBAN prefixes and display names.
+    MAJOR_BANK_PREFIXES = (
+        'ES0182', 'ES0049', 'ES2100', 'ES0081', 'ES0128',
+        'ES0003', 'ES0061', 'ES0188', 'ES0225', 'ES0198',
+    )
+    MAJOR_BANK_NAMES = (
+        'BBVA (Banco Bilbao Vizcaya Argentaria)',
+        'Santander (Banco Santander)',
+        'Caixabank',
+        'Sabadell (Banco de Sabadell)',
+        'Bankinter',
+        'Banco de Depósitos',
+        'Banca March',
+        'Banco Alcalá',
+        'Banco Cetelem',
+        'Banco Cooperativo Español',
+    )
+    
     def __init__(self, csv_file: Optional[str] = None):
         """
         Initialize the bank registry.
@@ -36,9 +109,35 @@ class BankRegistry:
                 raise FileNotFoundError("Could not find lista-psri-es.csv in any expected location")
         
         self.csv_file = csv_file
-        self.banks = self._load_banks()
+        self.cache_file = str(_cache_path(csv_file))
+        
+        # Taken before parsing, so a CSV replaced meanwhile is not cached as current
+        csv_stat = os.stat(csv_file)
+        banks = self._load_cache(csv_stat)
+        if banks is None:
+            banks = self._load_banks()
+            self._save_cache(banks, csv_stat)
+        self.banks = banks
+        self._entity_code_by_prefix = {
+            iban_prefix: bank_info.entity_code for iban_prefix, bank_info in self.banks.items()
+        }
+        self._prefix_by_entity_code = {
+            entity_code: iban_prefix for iban_prefix, entity_code in self._entity_code_by_prefix.items()
+        }
+        self._entity_codes = frozenset(self._prefix_by_entity_code)
+        
+        # Column layout for search_banks: all lowercased names joined into one
+        # string scanned by str.find, and the offset at which each row starts.
+        self._prefixes = list(self.banks)
+        self._names = [bank_info.name for bank_info in self.banks.values()]
+        self._name_offsets = []
+        offset = 0
+        for name in self._names:
+            self._name_offsets.append(offset)
+            offset += len(name.lower()) + len(_NAME_SEPARATOR)
+        self._lower_names = _NAME_SEPARATOR.join(name.lower() for name in self._names)
     
-    def _load_banks(self) -> Dict[str, Dict[str, str]]:
+    def _load_banks(self) -> Dict[str, BankInfo]:
         """
         Load bank information from the CSV file.
         
@@ -49,26 +148,101 @@ class BankRegistry:
         
         try:
             with open(self.csv_file, 'r', encoding='utf-8-sig') as file:
-                reader = csv.DictReader(file)
+                reader = csv.reader(file)
+                header = next(reader, [])
+                columns = {name: index for index, name in enumerate(header)}
+                
+                # Optional columns that are absent point one past the header,
+                # which every row is padded to below.
+                missing = len(header)
+                i_code = columns['CÓDIGO EUROPEO']
+                i_name = columns['NOMBRE']
+                i_address = columns['DIRECCIÓN']
+                i_lei = columns.get('LEI', missing)
+                i_operator = columns.get('OPERADOR', missing)
+                i_provider = columns.get('PROVEEDOR', missing)
+                i_supervisor = columns.get('CÓDIGO DE SUPERVISOR', missing)
+                
                 for row in reader:
-                    iban_prefix = row['CÓDIGO EUROPEO']
-                    bank_name = row['NOMBRE']
+                    if not row:
+                        continue
+                    if len(row) <= missing:
+                        row.extend([''] * (missing + 1 - len(row)))
                     
-                    banks[iban_prefix] = {
-                        'name': bank_name,
-                        'iban_prefix': iban_prefix,
-                        'address': row['DIRECCIÓN'],
-                        'entity_code': iban_prefix[2:] if len(iban_prefix) >= 6 else iban_prefix,
-                        'lei': row.get('LEI', ''),
-                        'operator': row.get('OPERADOR', ''),
-                        'provider': row.get('PROVEEDOR', ''),
-                        'supervisor_code': row.get('CÓDIGO DE SUPERVISOR', '')
-                    }
+                    iban_prefix = row[i_code]
+                    banks[iban_prefix] = BankInfo(
+                        name=row[i_name],
+                        iban_prefix=iban_prefix,
+                        address=row[i_address],
+                        entity_code=iban_prefix[2:] if len(iban_prefix) >= 6 else iban_prefix,
+                        lei=row[i_lei],
+                        operator=row[i_operator],
+                        provider=row[i_provider],
+                        supervisor_code=row[i_supervisor]
+                    )
         except Exception as e:
             raise RuntimeError(f"Error reading CSV file: {e}")
         
         return banks
     
+    def _load_cache(self, csv_stat: os.stat_result) -> Optional[Dict[str, BankInfo]]:
+        """
+        Load previously parsed bank information from the cache file.
+        
+        Args:
+            csv_stat: Current stat result of the CSV file.
+        
+        Returns:
+            The cached banks dictionary, or None if the cache is missing,
+            unreadable or was built from a CSV file with a different
+            modification time or size.
+        """
+        try:
+            with open(self.cache_file, 'rb') as file:
+                cached = pickle.load(file)
+        except Exception:
+            return None
+        
+        if (not isinstance(cached, dict) or cached.get('version') != _CACHE_VERSION
+                or cached.get('csv_mtime_ns') != csv_stat.st_mtime_ns
+                or cached.get('csv_size') != csv_stat.st_size):
+            return None
+        return cached.get('banks')
+    
+    def _save_cache(self, banks: Dict[str, BankInfo], csv_stat: os.stat_result) -> None:
+        """
+        Save parsed bank information to the cache file.
+        
+        Failures are ignored; the registry then simply parses the CSV again
+        on the next start.
+        
+        Args:
+            banks: The banks dictionary to cache.
+            csv_stat: Stat result of the CSV file the banks were parsed from.
+        """
+        payload = {
+            'version': _CACHE_VERSION,
+            'csv_mtime_ns': csv_stat.st_mtime_ns,
+            'csv_size': csv_stat.st_size,
+            'banks': banks,
+        }
+        temp_file = None
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Registries built concurrently (e.g. in pool workers) must never
+            # see a partly written cache, so it is renamed into place.
+            fd, temp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.cache_file)
+        except Exception:
+            if temp_file is not None:
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+    
     def get_major_banks(self) -> List[Tuple[str, str]]:
         """
         Get a list of major Spanish banks for quick selection.
@@ -76,25 +250,12 @@ class BankRegistry:
         Returns:
             List of tuples (iban_prefix, display_name) for major banks.
         """
-        major_banks = [
-            ('ES0182', 'BBVA (Banco Bilbao Vizcaya Argentaria)'),
-            ('ES0049', 'Santander (Banco Santander)'),
-            ('ES2100', 'Caixabank'),
-            ('ES0081', 'Sabadell (Banco de Sabadell)'),
-            ('ES0128', 'Bankinter'),
-            ('ES0003', 'Banco de Depósitos'),
-            ('ES0061', 'Banca March'),
-            ('ES0188', 'Banco Alcalá'),
-            ('ES0225', 'Banco Cetelem'),
-            ('ES0198', 'Banco Cooperativo Español'),
+        banks = self.banks
+        return [
+            (iban_prefix, display_name)
+            for iban_prefix, display_name in zip(self.MAJOR_BANK_PREFIXES, self.MAJOR_BANK_NAMES)
+            if iban_prefix in banks
         ]
-        
-        available_banks = []
-        for iban_prefix, display_name in major_banks:
-            if iban_prefix in self.banks:
-                available_banks.append((iban_prefix, display_name))
-        
-        return available_banks
     
     def search_banks(self, search_term: str) -> List[Tuple[str, str]]:
         """
@@ -115,11 +276,17 @@ class BankRegistry:
         if len(search_term) < 2:
             return []
         
-        for iban_prefix, bank_info in self.banks.items():
-            if search_term in bank_info['name'].lower():
-                matches.append((iban_prefix, bank_info['name']))
-                if len(matches) >= 100:
-                    break
+        if _NAME_SEPARATOR in search_term:
+            return []
+        
+        offsets = self._name_offsets
+        position = self._lower_names.find(search_term)
+        while position >= 0:
+            row = bisect_right(offsets, position) - 1
+            matches.append((self._prefixes[row], self._names[row]))
+            if len(matches) >= 100 or row + 1 == len(offsets):
+                break
+            position = self._lower_names.find(search_term, offsets[row + 1])
         
         return matches
     
@@ -133,7 +300,8 @@ class BankRegistry:
         Returns:
             Bank information dictionary or None if not found.
         """
-        return self.banks.get(iban_prefix)
+        bank_info = self.banks.get(iban_prefix)
+        return bank_info._asdict() if bank_info else None
     
     def get_all_banks(self) -> List[Tuple[str, str, str, str]]:
         """
@@ -146,9 +314,9 @@ class BankRegistry:
         for iban_prefix, bank_info in self.banks.items():
             all_banks.append((
                 iban_prefix,
-                bank_info['name'],
-                bank_info['entity_code'],
-                bank_info['address']
+                bank_info.name,
+                bank_info.entity_code,
+                bank_info.address
             ))
         return all_banks
     
@@ -162,8 +330,24 @@ class BankRegistry:
         Returns:
             The 4-digit entity code or None if not found.
         """
-        bank_info = self.get_bank_info(iban_prefix)
-        return bank_info['entity_code'] if bank_info else None
+        return self._entity_code_by_prefix.get(iban_prefix)
+    
+    def get_iban_prefix(self, entity_code: str) -> Optional[str]:
+        """
+        Get the IBAN prefix for a given entity code.
+        
+        Args:
+            entity_code: The 4-digit entity code (e.g., '0049').
+            
+        Returns:
+            The IBAN prefix or None if no bank has that entity code.
+        """
+        return self._prefix_by_entity_code.get(entity_code)
+    
+    @property
+    def entity_codes(self) -> frozenset:
+        """The set of 4-digit entity codes of all banks in the registry."""
+        return self._entity_codes
     
     def __len__(self) -> int:
         """Return the number of banks in the registry."""
@@ -4,15 +4,285 @@ Phone Number Extractor Module
 Core functionality for extracting phone numbers from Spanish bank IBAN data.
 """
 
+import codecs
+import mmap
+import multiprocessing
 import re
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Optional, Any
 from .bank_registry import BankRegistry
 import os
 
+# Block size used when counting newlines in memory-mapped files.
+_COUNT_BLOCK_SIZE = 1 << 20
+
+# Files at least this large are scanned by a pool of worker processes.
+_PARALLEL_MIN_SIZE = 32 << 20
+
+# Worker processes are spawned rather than forked: scans are started from
+# threads of the GUI, and forking a process with live threads can deadlock
+# the child.
+_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+# Minimum number of seconds between two progress reports of a large file.
+_PROGRESS_INTERVAL = 0.05
+
+# Extractor of a process pool worker, created on its first batch.
+_worker_extractor = None
+
+# The patterns rely on the Unicode-aware \s, \d and \b of re (e.g. digits
+# grouped with no-break spaces, no match right after a letter like 'ñ'), so
+# they must not be handed to an ASCII-only engine such as RE2.
+_IBAN_RE = re.compile(r'(?i)ES\d{2}\s?\d{4}\s?\d{4}\s?\d{4}\s?\d{4}\s?\d{4}')
+_VALIDATE_IBAN_RE = re.compile(r'^ES\d{2}\s*\d{4}\s*\d{4}\s*\d{4}\s*\d{4}\s*\d{4}$')
+
+# Spanish phone number formats; numbers starting with 8 are excluded, and
+# ones starting with 9 are only accepted with the +34 prefix.
+# The alternatives are joined so each text is scanned once. Longer, more
+# specific branches come first so +34 numbers win over the bare national
+# digits they contain.
+_PHONE_PATTERNS = [
+    r'\+34\s*(?!8)(?:\d{2,3}\s*\d{3}\s*\d{2}\s*\d{2}|\d{9})',  # +34 123 45 67 89, +34123456789
+    r'\b[67](?:\d{2}\s*\d{3}\s*\d{2}\s*\d{2}|\d{8})\b',  # 612 345 67 89, 712345678
+]
+_PHONE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _PHONE_PATTERNS))
+
+
+def _count_newlines(buffer, start: int, end: int) -> int:
+    """
+    Count newline bytes in ``buffer[start:end]``.
+    
+    The range is counted in fixed-size blocks so memory-mapped files are
+    never copied into memory all at once.
+    
+    Args:
+        buffer: A bytes-like object supporting slicing (e.g. an mmap).
+        start: Start offset (inclusive).
+        end: End offset (exclusive).
+        
+    Returns:
+        Number of newline bytes in the range.
+    """
+    count = 0
+    for block_start in range(start, end, _COUNT_BLOCK_SIZE):
+        count += buffer[block_start:min(block_start + _COUNT_BLOCK_SIZE, end)].count(b'\n')
+    return count
+
+
+def _has_lone_carriage_return(buffer, start: int, end: int) -> bool:
+    """
+    Check whether ``buffer[start:end]`` holds a carriage return outside a CRLF.
+    
+    Text mode also ends lines at such a carriage return, while the byte level
+    scan only ends them at newlines.
+    
+    Args:
+        buffer: A bytes-like object supporting slicing (e.g. an mmap).
+        start: Start offset (inclusive).
+        end: End offset (exclusive).
+        
+    Returns:
+        True if a lone carriage return was found.
+    """
+    for block_start in range(start, end, _COUNT_BLOCK_SIZE):
+        # One extra byte keeps a CRLF split across blocks together
+        block = buffer[block_start:min(block_start + _COUNT_BLOCK_SIZE + 1, end)]
+        limit = min(_COUNT_BLOCK_SIZE, len(block))
+        if b'\r' in block and block.count(b'\r', 0, limit) != block.count(b'\r\n', 0, limit + 1):
+            return True
+    return False
+
+
+def _find_phone_numbers(phone_pattern, text: str) -> List[str]:
+    """
+    Find unique phone numbers in text, preserving their order.
+    
+    Args:
+        phone_pattern: Compiled phone number pattern.
+        text: The text to search.
+        
+    Returns:
+        List of phone numbers in order of first appearance.
+    """
+    return list(dict.fromkeys(phone_pattern.findall(text)))
+
+
+def _extract_phones_for_entity(phone_pattern, entity_code: str, text: str) -> List[str]:
+    """
+    Extract phone numbers from text containing an IBAN of the given bank.
+    
+    Args:
+        phone_pattern: Compiled phone number pattern.
+        entity_code: The already resolved 4-digit entity code of the bank.
+        text: The text to extract phone numbers from.
+        
+    Returns:
+        List of extracted phone numbers.
+    """
+    # Cheap substring test before anything else; most lines of a typical
+    # export carry no IBAN at all, and only IBANs starting with an
+    # uppercase 'ES' are accepted.
+    if 'ES' not in text:
+        return []
+
+    # An IBAN of this bank carries the entity code as four contiguous digits,
+    # so lines holding only other banks' IBANs are rejected by one substring
+    # search.
+    clean_text = text.replace('-', '') if '-' in text else text
+    if entity_code not in clean_text:
+        return []
+
+    # Walk the 'ES' markers with str.find and compare the entity code in
+    # place; the IBAN regex only confirms a candidate that already matches.
+    position = clean_text.find('ES')
+    while position >= 0:
+        offset = position + 4
+        if clean_text[position + 2:offset].isdigit():
+            # The entity code may be separated from the check digits by a space
+            if clean_text[offset:offset + 1] == ' ':
+                offset += 1
+            if clean_text[offset:offset + 4] == entity_code and _IBAN_RE.match(clean_text, position):
+                break
+        position = clean_text.find('ES', position + 2)
+    else:
+        return []
+
+    return _find_phone_numbers(phone_pattern, text)
+
+
+def _split_segments(buffer, start: int, end: int, segment_size: int) -> List[tuple]:
+    """
+    Split ``buffer[start:end]`` into ranges that each end after a newline.
+    
+    Args:
+        buffer: A bytes-like object supporting find (e.g. an mmap).
+        start: Start offset (inclusive).
+        end: End offset (exclusive).
+        segment_size: Approximate size of each range in bytes.
+        
+    Returns:
+        List of (segment_start, segment_end) tuples covering the range.
+    """
+    segments = []
+    while start < end:
+        newline = buffer.find(b'\n', min(start + segment_size, end) - 1, end)
+        segment_end = end if newline < 0 else newline + 1
+        segments.append((start, segment_end))
+        start = segment_end
+    return segments
+
+
+def _scan_segment(buffer, start: int, end: int, phone_pattern, entity_code: str) -> tuple:
+    """
+    Extract phone numbers from the lines in ``buffer[start:end]``.
+    
+    The buffer is searched at byte level for the 'ES' marker every IBAN
+    starts with; only the lines containing it and the entity code are
+    decoded. Line numbers are relative to the segment, starting at 1.
+    
+    Args:
+        buffer: A bytes-like object supporting find and slicing (e.g. an mmap).
+        start: Offset of the first line in the range.
+        end: Offset just past the last line in the range.
+        phone_pattern: Compiled phone number pattern.
+        entity_code: The resolved 4-digit entity code of the bank.
+        
+    Returns:
+        Tuple (results, line_count) with the list of dictionaries with line
+        information and phone numbers, and the number of newline-terminated
+        lines in the segment.
+    """
+    results = []
+    position = start
+    line_num = 1
+    entity_bytes = entity_code.encode('ascii')
+    
+    while position < end:
+        hit = buffer.find(b'ES', position, end)
+        if hit < 0:
+            break
+        
+        newline = buffer.rfind(b'\n', position, hit)
+        line_start = position if newline < 0 else newline + 1
+        line_end = buffer.find(b'\n', hit, end)
+        if line_end < 0:
+            line_end = end
+        line_num += _count_newlines(buffer, position, line_start)
+        
+        # Skip lines that lack the entity code without decoding them; only a
+        # dash can split it, as dashes are removed before matching IBANs.
+        if (buffer.find(entity_bytes, line_start, line_end) >= 0
+                or buffer.find(b'-', line_start, line_end) >= 0):
+            line = buffer[line_start:line_end].decode('utf-8', 'replace').strip()
+            phone_numbers = _extract_phones_for_entity(phone_pattern, entity_code, line)
+            if phone_numbers:
+                results.append({
+                    'line_number': line_num,
+                    'text': line,
+                    'phone_numbers': phone_numbers,
+                    'phone_count': len(phone_numbers)
+                })
+        
+        position = line_end + 1
+        line_num += 1
+    
+    return results, line_num - 1 + _count_newlines(buffer, position, end)
+
+
+def _scan_file_segment(file_path: str, start: int, end: int, entity_code: str) -> tuple:
+    """
+    Worker process entry point: map the file and scan one segment of it.
+    
+    Uses the module-level phone pattern, compiled once when the worker
+    imports this module, so only plain values cross the process boundary.
+    
+    Args:
+        file_path: Path to the file to process.
+        start: Offset of the first line in the segment.
+        end: Offset just past the last line in the segment.
+        entity_code: The resolved 4-digit entity code of the bank.
+        
+    Returns:
+        Tuple (results, line_count) as returned by _scan_segment.
+    """
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _scan_segment(buffer, start, end, _PHONE_RE, entity_code)
+
+
+def _process_text_batch(iban_prefix: str, text: str) -> List[Dict[str, Any]]:
+    """
+    Worker process entry point: extract phone numbers from a batch of lines.
+    
+    Lives here rather than in the GUI so pool workers import no Qt modules.
+    The extractor is created on the first batch of each worker.
+    
+    Args:
+        iban_prefix: The IBAN prefix of the bank to filter by.
+        text: The lines to process.
+        
+    Returns:
+        List of dictionaries with line information and phone numbers, as
+        returned by SpanishBankExtractor.process_text.
+    """
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = SpanishBankExtractor()
+    return _worker_extractor.process_text(iban_prefix, text)
+
 
 class SpanishBankExtractor:
     """Main class for extracting phone numbers from Spanish bank IBAN data."""
     
+    __slots__ = ('bank_registry',)
+    
+    # Shared by all instances; compiled once at import.
+    _phone_pattern = _PHONE_RE
+    
     def __init__(self, bank_registry: Optional[BankRegistry] = None):
         """
         Initialize the extractor.
@@ -21,24 +291,6 @@ class SpanishBankExtractor:
             bank_registry: Bank registry instance. If None, creates a new one.
         """
         self.bank_registry = bank_registry or BankRegistry()
-        self._phone_patterns = self._compile_phone_patterns()
-    
-    def _compile_phone_patterns(self) -> List[re.Pattern]:
-        """
-        Compile phone number patterns for Spanish numbers.
-        Excludes numbers starting with 8 and 9.
-        
-        Returns:
-            List of compiled regex patterns.
-        """
-        patterns = [
-            r'\+34\s*\d{9}',  # +34 123456789 or +34123456789
-            r'\+34\s*\d{2,3}\s*\d{3}\s*\d{2}\s*\d{2}',  # +34 12 345 67 89 or +34 123 45 67 89
-            r'\b[67]\d{8}\b',  # 612345678, 712345678
-            r'\b[67]\d{2}\s*\d{3}\s*\d{2}\s*\d{2}\b',  # 612 345 67 89, 712 345 67 89
-        ]
-        
-        return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
     
     def extract_phone_numbers(self, iban_prefix: str, text: str) -> List[str]:
         """
@@ -51,38 +303,67 @@ class SpanishBankExtractor:
         Returns:
             List of extracted phone numbers.
         """
-        normalized_prefix = self.normalize_iban_prefix(iban_prefix)
-        entity_code = self.bank_registry.get_entity_code(normalized_prefix)
+        entity_code = self._resolve_entity_code(iban_prefix)
         if not entity_code:
             return []
-
-        iban_pattern = re.compile(r'ES\d{2}\s?\d{4}\s?\d{4}\s?\d{4}\s?\d{4}\s?\d{4}', re.IGNORECASE)
-        ibans_in_line = iban_pattern.findall(text.replace('-', ''))
-        found_match = False
-        for iban in ibans_in_line:
-            clean_iban = iban.replace(' ', '')
-            if len(clean_iban) >= 8 and clean_iban.startswith('ES'):
-                iban_entity_code = clean_iban[4:8]
-                if iban_entity_code == entity_code:
-                    found_match = True
-                    break
-        if not found_match:
-            return []
-
-        phone_numbers = []
-        for pattern in self._phone_patterns:
-            matches = pattern.findall(text)
-            phone_numbers.extend(matches)
+        return _extract_phones_for_entity(self._phone_pattern, entity_code, text)
+    
+    def _resolve_entity_code(self, iban_prefix: str) -> Optional[str]:
+        """
+        Resolve an IBAN prefix to the entity code of a registered bank.
+        
+        Args:
+            iban_prefix: The IBAN prefix of the bank (e.g., 'ES91 0049' or 'ES0049').
+            
+        Returns:
+            The 4-digit entity code or None if the bank is unknown.
+        """
+        normalized_prefix = self.normalize_iban_prefix(iban_prefix)
+        return self.bank_registry.get_entity_code(normalized_prefix)
+    
+    def extract_phone_numbers_multi(self, text: str) -> Dict[str, List[str]]:
+        """
+        Extract phone numbers from text for every bank whose IBAN appears in it.
         
-        seen = set()
-        unique_phones = []
-        for phone in phone_numbers:
-            if phone not in seen:
-                seen.add(phone)
-                unique_phones.append(phone)
-        return unique_phones
+        The text is scanned once for IBANs and once for phone numbers, no
+        matter how many banks the registry holds.
+        
+        Args:
+            text: The text to extract phone numbers from.
+            
+        Returns:
+            Dictionary mapping the IBAN prefix of each bank found in the text
+            to the extracted phone numbers.
+        """
+        if 'ES' not in text:
+            return {}
+        
+        entity_codes = self.bank_registry.entity_codes
+        iban_prefixes = []
+        clean_text = text.replace('-', '') if '-' in text else text
+        position = clean_text.find('ES')
+        while position >= 0:
+            offset = position + 4
+            if clean_text[position + 2:offset].isdigit():
+                if clean_text[offset:offset + 1] == ' ':
+                    offset += 1
+                entity_code = clean_text[offset:offset + 4]
+                if entity_code in entity_codes and _IBAN_RE.match(clean_text, position):
+                    iban_prefix = self.bank_registry.get_iban_prefix(entity_code)
+                    if iban_prefix not in iban_prefixes:
+                        iban_prefixes.append(iban_prefix)
+            position = clean_text.find('ES', position + 2)
+        if not iban_prefixes:
+            return {}
+        
+        phone_numbers = _find_phone_numbers(self._phone_pattern, text)
+        if not phone_numbers:
+            return {}
+        return {iban_prefix: list(phone_numbers) for iban_prefix in iban_prefixes}
     
-    def normalize_iban_prefix(self, iban_prefix: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def normalize_iban_prefix(iban_prefix: str) -> str:
         """
         Normalize IBAN prefix to match registry format.
         
@@ -92,15 +373,18 @@ class SpanishBankExtractor:
         Returns:
             Normalized prefix (e.g., 'ES0049')
         """
-        clean_prefix = iban_prefix.replace(' ', '')
+        # Already in registry format, e.g. 'ES0049'
+        if len(iban_prefix) == 6 and iban_prefix.startswith('ES') and iban_prefix[2:].isdigit():
+            return iban_prefix
+        
+        clean_prefix = iban_prefix.replace(' ', '') if ' ' in iban_prefix else iban_prefix
         
         if clean_prefix.startswith('ES') and len(clean_prefix) > 2:
             if len(clean_prefix) == 6 and clean_prefix[2:6].isdigit():
                 return clean_prefix
             
             if len(clean_prefix) >= 6:
-                entity_code = clean_prefix[4:8]
-                return f"ES{entity_code}"
+                return 'ES' + clean_prefix[4:8]
         
         return clean_prefix
     
@@ -115,20 +399,42 @@ class SpanishBankExtractor:
         Returns:
             List of dictionaries with line information and phone numbers.
         """
-        lines = text.split('\n')
+        entity_code = self._resolve_entity_code(iban_prefix)
+        if not entity_code:
+            return []
+        
         results = []
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if line:
-                phone_numbers = self.extract_phone_numbers(iban_prefix, line)
-                if phone_numbers:
-                    results.append({
-                        'line_number': i + 1,
-                        'text': line,
-                        'phone_numbers': phone_numbers,
-                        'phone_count': len(phone_numbers)
-                    })
+        # Jump between the 'ES' markers every IBAN starts with instead of
+        # visiting each line; line numbers come from counting the newlines
+        # skipped in between.
+        phone_pattern = self._phone_pattern
+        position = 0
+        line_num = 1
+        while True:
+            hit = text.find('ES', position)
+            if hit < 0:
+                break
+            
+            newline = text.rfind('\n', position, hit)
+            line_start = position if newline < 0 else newline + 1
+            line_end = text.find('\n', hit)
+            if line_end < 0:
+                line_end = len(text)
+            line_num += text.count('\n', position, line_start)
+            
+            line = text[line_start:line_end].strip()
+            phone_numbers = _extract_phones_for_entity(phone_pattern, entity_code, line)
+            if phone_numbers:
+                results.append({
+                    'line_number': line_num,
+                    'text': line,
+                    'phone_numbers': phone_numbers,
+                    'phone_count': len(phone_numbers)
+                })
+            
+            position = line_end + 1
+            line_num += 1
         
         return results
     
@@ -150,84 +456,181 @@ class SpanishBankExtractor:
         except Exception as e:
             raise RuntimeError(f"Error processing file {file_path}: {e}")
     
-    def process_large_file(self, iban_prefix: str, file_path: str, chunk_size: int = 10000, progress_callback=None) -> List[Dict[str, Any]]:
+    def process_large_file(self, iban_prefix: str, file_path: str, chunk_size: int = 10000, progress_callback=None, max_workers: Optional[int] = None, executor: Optional[Executor] = None) -> List[Dict[str, Any]]:
         """
-        Process large files in chunks to avoid memory issues.
+        Process large files without loading them into memory.
+        
+        The file is memory-mapped and split into segments of roughly
+        ``chunk_size`` lines. When ``max_workers`` or ``executor`` allows it,
+        files of at least 32 MB are scanned by a pool of worker processes,
+        smaller ones always in the calling process.
+        
+        Lines end at newlines, CRLFs and, as in text mode, lone carriage
+        returns; files containing the latter are read in text mode instead.
+        
+        The workers are spawned, so they import the caller's ``__main__``
+        module again; scripts opting into parallel scans must guard their
+        entry point with ``if __name__ == '__main__':``.
         
         Args:
             iban_prefix: The IBAN prefix of the bank to filter by.
             file_path: Path to the file to process.
-            chunk_size: Number of lines to process at once.
-            progress_callback: Optional callback function for progress reporting.
+            chunk_size: Approximate number of lines per segment (and between progress reports).
+            progress_callback: Optional callback function for progress reporting, called
+                               with (percent, bytes_processed, total_bytes) at most
+                               every 50 ms and once at the end. It runs between
+                               segments; an exception raised from it aborts the scan
+                               after the current segment and cancels queued ones.
+            max_workers: Maximum number of worker processes. None (the default) or 1
+                         scans in the calling process; pass e.g. os.cpu_count()
+                         to opt into parallel processing. With an executor it
+                         bounds the segments queued at once and defaults to the
+                         CPU count.
+            executor: Optional existing process pool to scan in instead of starting
+                      one for this call; it is left running afterwards.
             
         Returns:
             List of dictionaries with line information and phone numbers.
         """
         results = []
-        total_lines = 0
-        processed_lines = 0
+        
+        entity_code = self._resolve_entity_code(iban_prefix)
+        if not entity_code:
+            return results
         
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as file:
-                total_lines = sum(1 for _ in file)
-            
-            with open(file_path, 'r', encoding='utf-8-sig') as file:
-                chunk_lines = []
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return results
                 
-                for line_num, line in enumerate(file, 1):
-                    chunk_lines.append((line_num, line.strip()))
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    size = len(buffer)
+                    start = len(codecs.BOM_UTF8) if buffer[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+                    if _has_lone_carriage_return(buffer, start, size):
+                        return self._process_text_file(iban_prefix, file_path, chunk_size, progress_callback)
                     
-                    if len(chunk_lines) >= chunk_size:
-                        chunk_results = self._process_chunk(iban_prefix, chunk_lines)
-                        results.extend(chunk_results)
-                        
-                        processed_lines += len(chunk_lines)
-                        if progress_callback:
-                            progress = (processed_lines / total_lines) * 100
-                            progress_callback(progress, processed_lines, total_lines)
-                        
-                        chunk_lines = []
-                
-                if chunk_lines:
-                    chunk_results = self._process_chunk(iban_prefix, chunk_lines)
-                    results.extend(chunk_results)
+                    # Size segments from the average line length of the first
+                    # block instead of counting every line up front.
+                    sample = buffer[start:start + _COUNT_BLOCK_SIZE]
+                    segment_size = max(1, len(sample) * chunk_size // max(1, sample.count(b'\n')))
+                    segments = _split_segments(buffer, start, size, segment_size)
+                    
+                    default_workers = (os.cpu_count() or 1) if executor is not None else 1
+                    workers = min(max_workers or default_workers, len(segments))
+                    if workers > 1 and size >= _PARALLEL_MIN_SIZE:
+                        segment_results = self._scan_segments_parallel(file_path, segments, entity_code, workers, executor)
+                    else:
+                        segment_results = (
+                            _scan_segment(buffer, segment_start, segment_end, self._phone_pattern, entity_code)
+                            for segment_start, segment_end in segments
+                        )
                     
-                    processed_lines += len(chunk_lines)
-                    if progress_callback:
-                        progress = (processed_lines / total_lines) * 100
-                        progress_callback(progress, processed_lines, total_lines)
+                    # Segment line numbers start at 1; shift them by the lines
+                    # of the segments before.
+                    line_offset = 0
+                    last_report = time.monotonic()
+                    try:
+                        for (segment_start, segment_end), (chunk_results, line_count) in zip(segments, segment_results):
+                            for result in chunk_results:
+                                result['line_number'] += line_offset
+                            results.extend(chunk_results)
+                            line_offset += line_count
+                            
+                            # Throttle reports so a UI callback cannot dominate fast scans;
+                            # the final one is always delivered.
+                            if progress_callback:
+                                now = time.monotonic()
+                                if segment_end == size or now - last_report >= _PROGRESS_INTERVAL:
+                                    last_report = now
+                                    progress_callback((segment_end / size) * 100, segment_end, size)
+                    finally:
+                        # Stop the pool right away when the callback aborts the scan
+                        segment_results.close()
                         
         except Exception as e:
             raise RuntimeError(f"Error processing large file {file_path}: {e}")
         
         return results
     
-    def _process_chunk(self, iban_prefix: str, chunk_lines: List[tuple]) -> List[Dict[str, Any]]:
+    def _process_text_file(self, iban_prefix: str, file_path: str, chunk_size: int, progress_callback) -> List[Dict[str, Any]]:
         """
-        Process a chunk of lines.
+        Process a file read in text mode, in batches of ``chunk_size`` lines.
+        
+        Used by process_large_file for files whose lines the byte level scan
+        cannot delimit, i.e. ones ending lines with lone carriage returns.
         
         Args:
             iban_prefix: The IBAN prefix of the bank to filter by.
-            chunk_lines: List of (line_number, line_text) tuples.
+            file_path: Path to the file to process.
+            chunk_size: Number of lines per batch.
+            progress_callback: Optional callback, as for process_large_file.
             
         Returns:
             List of dictionaries with line information and phone numbers.
         """
         results = []
+        size = os.path.getsize(file_path)
+        line_offset = 0
+        last_report = time.monotonic()
+        with open(file_path, 'r', encoding='utf-8-sig', errors='replace') as file:
+            while True:
+                lines = list(islice(file, chunk_size))
+                if not lines:
+                    break
+                
+                chunk_results = self.process_text(iban_prefix, ''.join(lines))
+                for result in chunk_results:
+                    result['line_number'] += line_offset
+                results.extend(chunk_results)
+                line_offset += len(lines)
+                
+                if progress_callback:
+                    now = time.monotonic()
+                    if now - last_report >= _PROGRESS_INTERVAL:
+                        last_report = now
+                        # The binary buffer runs slightly ahead of the lines read
+                        position = min(file.buffer.tell(), size)
+                        progress_callback((position / size) * 100, position, size)
         
-        for line_num, line in chunk_lines:
-            if line:
-                phone_numbers = self.extract_phone_numbers(iban_prefix, line)
-                if phone_numbers:
-                    results.append({
-                        'line_number': line_num,
-                        'text': line,
-                        'phone_numbers': phone_numbers,
-                        'phone_count': len(phone_numbers)
-                    })
-        
+        if progress_callback:
+            progress_callback(100.0, size, size)
         return results
     
+    def _scan_segments_parallel(self, file_path: str, segments: List[tuple], entity_code: str, workers: int, executor: Optional[Executor] = None):
+        """
+        Scan file segments in a pool of worker processes.
+        
+        Args:
+            file_path: Path to the file to process.
+            segments: List of (start, end) tuples.
+            entity_code: The resolved 4-digit entity code of the bank.
+            workers: Number of worker processes.
+            executor: Optional process pool to use; if None, one with ``workers``
+                      processes is started and shut down when done.
+            
+        Yields:
+            The (results, line_count) tuple of each segment, in segment order.
+        """
+        # Only a few segments per worker are queued at a time, so closing the
+        # generator early leaves just the running ones to finish.
+        owns_executor = executor is None
+        if owns_executor:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=_POOL_CONTEXT)
+        pending = deque()
+        try:
+            for segment_start, segment_end in segments:
+                pending.append(executor.submit(_scan_file_segment, file_path, segment_start, segment_end, entity_code))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            if owns_executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                for future in pending:
+                    future.cancel()
+    
     def estimate_file_size(self, file_path: str) -> dict:
         """
         Estimate file size and processing requirements.
@@ -240,18 +643,22 @@ class SpanishBankExtractor:
         """
         try:
             file_size = os.path.getsize(file_path)
-            line_count = 0
             
-            with open(file_path, 'r', encoding='utf-8-sig') as file:
-                for _ in file:
-                    line_count += 1
-                    if line_count > 10000:
+            # Counting newlines in large binary blocks is cheap enough to give
+            # the exact number of lines instead of extrapolating from a sample.
+            newline_count = 0
+            last_block = b''
+            with open(file_path, 'rb') as file:
+                while True:
+                    block = file.read(_COUNT_BLOCK_SIZE)
+                    if not block:
                         break
+                    newline_count += block.count(b'\n')
+                    last_block = block
             
-            if line_count == 10000:
-                estimated_lines = int((file_size / file.tell()) * line_count)
-            else:
-                estimated_lines = line_count
+            estimated_lines = newline_count
+            if last_block and not last_block.endswith(b'\n'):
+                estimated_lines += 1
             
             return {
                 'file_size_bytes': file_size,
@@ -316,8 +723,7 @@ class SpanishBankExtractor:
         Returns:
             True if the IBAN format is valid, False otherwise.
         """
-        pattern = r'^ES\d{2}\s*\d{4}\s*\d{4}\s*\d{4}\s*\d{4}\s*\d{4}$'
-        return bool(re.match(pattern, iban.replace(' ', '')))
+        return bool(_VALIDATE_IBAN_RE.match(iban.replace(' ', '')))
     
     def extract_entity_code_from_iban(self, iban: str) -> Optional[str]:
         """
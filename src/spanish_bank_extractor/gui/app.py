@@ -7,103 +7,242 @@ This is the main GUI entrypoint for the application.
 
 import sys
 import os
+import codecs
+import csv
+import multiprocessing
+import threading
+import operator
+from collections import deque
+from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QComboBox, QTextEdit, QLineEdit, QPushButton, QLabel, QFileDialog,
-    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView,
+    QComboBox, QPlainTextEdit, QLineEdit, QPushButton, QLabel, QFileDialog,
+    QTabWidget, QTableView, QHeaderView,
     QMessageBox, QProgressBar, QSplitter, QFrame, QScrollArea,
     QDialog, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize
-from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPixmap
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QSize, QAbstractTableModel, QModelIndex, QLocale
+from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPixmap, QTextCursor
 
-from ..core.extractor import SpanishBankExtractor
+from ..core.extractor import SpanishBankExtractor, _process_text_batch
 from ..core.bank_registry import BankRegistry
 
 
+# Size of the blocks large text files are read in.
+CHUNK_SIZE = 128 * 1024
+
+# Text files above this size are read in chunks to report progress; smaller
+# ones are read with a single call.
+LARGE_FILE_THRESHOLD = 100 * 1024 * 1024
+
+# UTF-8 text files above this size are processed straight from the file
+# through a memory map instead of from a copy of the input text.
+MMAP_MIN_SIZE = 10 * 1024 * 1024
+
+# Number of leading bytes inspected to detect the encoding of a text file.
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Encodings considered for files that are not UTF-8; limiting the candidates
+# keeps charset_normalizer from picking unrelated code pages for Spanish text.
+ENCODING_CANDIDATES = ['cp1252', 'latin_1', 'iso8859_15']
+
+# Loaded files longer than PREVIEW_MIN_CHARS characters, and Excel files with
+# more than PREVIEW_LINES rows, only show their first PREVIEW_LINES lines in
+# the input area; the whole content is still processed.
+PREVIEW_MIN_CHARS = 1000000
+PREVIEW_LINES = 10000
+
+# Number of Excel rows sent to the GUI per batch while loading.
+EXCEL_BATCH_SIZE = 1000
+
+# Excel rows being loaded, and results being exported, are checked for a
+# cancellation request (and report progress) every INTERRUPTION_CHECK_MASK + 1 rows.
+INTERRUPTION_CHECK_MASK = 1023
+
+# Number of lines (or characters, for plain text) ProcessingTask hands to
+# the extractor at once; progress and cancellation are checked between batches.
+PROCESSING_BATCH_SIZE = 4096
+PROCESSING_BATCH_CHARS = 256 * 1024
+
+# ProcessingTask hands results to the GUI in chunks of at least this many rows,
+# so the first matches show while the rest of the input is processed.
+RESULTS_CHUNK_SIZE = 500
+
+# Inputs with at least this many lines are processed by a pool of worker
+# processes when more than one CPU is available.
+PARALLEL_MIN_LINES = 100000
+
+# The banks table is searched once typing in the search box has paused for this
+# many milliseconds, instead of on every keystroke.
+SEARCH_DEBOUNCE_MS = 200
+
+# Column widths of Excel exports are fitted to the header and this many
+# leading rows, so the rows can be streamed to the file.
+EXCEL_WIDTH_SAMPLE_ROWS = 1000
+
+# Buffer size of the files results are exported to.
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Dark color scheme applied to the application palette by main().
+DARK_PALETTE_COLORS = (
+    (QPalette.ColorRole.Window, QColor("#1e1e1e")),
+    (QPalette.ColorRole.WindowText, QColor("#ffffff")),
+    (QPalette.ColorRole.Base, QColor("#2d2d30")),
+    (QPalette.ColorRole.AlternateBase, QColor("#252526")),
+    (QPalette.ColorRole.ToolTipBase, QColor("#2d2d30")),
+    (QPalette.ColorRole.ToolTipText, QColor("#ffffff")),
+    (QPalette.ColorRole.Text, QColor("#ffffff")),
+    (QPalette.ColorRole.Button, QColor("#3e3e42")),
+    (QPalette.ColorRole.ButtonText, QColor("#ffffff")),
+    (QPalette.ColorRole.BrightText, QColor("#ffffff")),
+    (QPalette.ColorRole.Link, QColor("#0078d4")),
+    (QPalette.ColorRole.Highlight, QColor("#0078d4")),
+    (QPalette.ColorRole.HighlightedText, QColor("white")),
+)
+
+# Stylesheet of the application, read once on first use.
+STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), 'styles.qss')
+
+
+@lru_cache(maxsize=None)
+def _font(family: str, point_size: int, weight=None) -> QFont:
+    """
+    Return a shared QFont for the given family, size and weight.
+    
+    Widgets copy the fonts they are given, so one instance per combination
+    serves the whole window.
+    """
+    if weight is None:
+        return QFont(family, point_size)
+    return QFont(family, point_size, weight)
+
+
+@lru_cache(maxsize=None)
+def _load_stylesheet() -> str:
+    """Read the application stylesheet shipped next to this module."""
+    with open(STYLESHEET_PATH, 'r', encoding='utf-8') as file:
+        return file.read()
+
+
+class UIState(Enum):
+    """What the window is busy with, if anything; the value of a busy state is its progress bar format."""
+    
+    IDLE = None
+    LOADING = "Loading file... %p%"
+    PROCESSING = "Processing data... %p%"
+    EXPORTING = "Exporting results... %p%"
+
+
 class ModernButton(QPushButton):
     """Custom modern button with styling."""
     
     def __init__(self, text: str, primary: bool = False):
         super().__init__(text)
         self.setMinimumHeight(40)
-        self.setFont(QFont("Segoe UI", 10))
-        
-        if primary:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #0078d4;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: #106ebe;
-                }
-                QPushButton:pressed {
-                    background-color: #005a9e;
-                }
-                QPushButton:disabled {
-                    background-color: #cccccc;
-                    color: #666666;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #f3f2f1;
-                    color: #323130;
-                    border: 1px solid #d2d0ce;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background-color: #edebe9;
-                    border-color: #c7c6c4;
-                }
-                QPushButton:pressed {
-                    background-color: #e1dfdd;
-                }
-                QPushButton:disabled {
-                    background-color: #f3f2f1;
-                    color: #a19f9d;
-                    border-color: #edebe9;
-                }
-            """)
+        self.setFont(_font("Segoe UI", 10))
+        
+        # Styled by the application stylesheet
+        self.setProperty("class", "primary" if primary else "secondary")
+
+
+class BackgroundTask(QRunnable):
+    """
+    Work run on the global thread pool, which reuses its threads across tasks.
+    
+    Provides the part of the QThread interface the window relies on:
+    start, isRunning, wait and interruption requests. Subclasses implement
+    execute() and emit through a QObject held in ``signals``.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        # The window keeps the task after it finished; Qt must not delete it
+        self.setAutoDelete(False)
+        self._interruption_requested = False
+        self._finished = threading.Event()
+        self._finished.set()
+    
+    def start(self):
+        """Queue the task on the global thread pool."""
+        self._finished.clear()
+        QThreadPool.globalInstance().start(self)
+    
+    def run(self):
+        """Called by the thread pool; runs execute()."""
+        try:
+            self.execute()
+        finally:
+            self._finished.set()
+    
+    def execute(self):
+        """Do the work of the task."""
+        raise NotImplementedError
+    
+    def isRunning(self) -> bool:
+        """Return whether the task is queued or running."""
+        return not self._finished.is_set()
+    
+    def wait(self, msecs: int) -> bool:
+        """Wait up to msecs milliseconds for the task to finish."""
+        return self._finished.wait(msecs / 1000)
+    
+    def requestInterruption(self):
+        """Ask the task to stop at its next check."""
+        self._interruption_requested = True
+    
+    def isInterruptionRequested(self) -> bool:
+        """Return whether requestInterruption() was called."""
+        return self._interruption_requested
 
 
-class FileLoaderThread(QThread):
-    """Thread for loading files asynchronously to prevent GUI freezing."""
+class FileLoaderSignals(QObject):
+    """Signals of FileLoaderTask."""
     
-    file_loaded = pyqtSignal(str)
+    # The loaded text is passed by reference instead of being converted to a QString
+    file_loaded = pyqtSignal(object)
+    rows_loaded = pyqtSignal(list)
+    rows_complete = pyqtSignal()
     error_occurred = pyqtSignal(str)
     progress_updated = pyqtSignal(int)
+
+
+class FileLoaderTask(BackgroundTask):
+    """Task for loading files asynchronously to prevent GUI freezing."""
     
     def __init__(self, file_path: str, file_extension: str):
         super().__init__()
+        self.signals = FileLoaderSignals()
         self.file_path = file_path
         self.file_extension = file_extension
+        # Set to file_path when the loaded text can be processed from the file itself
+        self.scan_path = None
     
-    def run(self):
-        """Load the file in a separate thread."""
+    def execute(self):
+        """Load the file in a pooled thread."""
         try:
             if self.file_extension in ['.xlsx', '.xls']:
-                content = self._read_excel_file()
+                if self._read_excel_file():
+                    self.signals.rows_complete.emit()
+                    return
+                content = ""
             else:
                 content = self._read_text_file()
             
-            self.file_loaded.emit(content)
+            self.signals.file_loaded.emit(content)
             
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            self.signals.error_occurred.emit(str(e))
     
-    def _read_excel_file(self) -> str:
-        """Read Excel file and return content as text."""
+    def _read_excel_file(self) -> bool:
+        """
+        Read Excel file and emit its non-empty rows in batches via rows_loaded.
+        
+        Returns:
+            True if all rows were read, False if loading was interrupted.
+        """
         try:
-            import openpyxl
             from openpyxl import load_workbook
         except ImportError:
             raise RuntimeError("openpyxl is required to read Excel files. Please install it with: pip install openpyxl")
@@ -117,68 +256,118 @@ class FileLoaderThread(QThread):
                 if worksheet is None:
                     raise RuntimeError("No worksheets found in the Excel file")
             
-            content_lines = []
-            row_count = 0
+            batch = []
+            append = batch.append
+            is_value = partial(operator.is_not, None)
             
-            max_row = worksheet.max_row
-            progress_interval = max(1, max_row // 100)
+            # The row count of a read-only sheet is only known after a full
+            # scan, so progress is indeterminate until loading finishes.
+            self.signals.progress_updated.emit(-1)
             
-            for row in worksheet.iter_rows(values_only=True):
-                if self.isInterruptionRequested():
-                    return ""
-                
-                row_text = []
-                for cell_value in row:
-                    if cell_value is not None:
-                        row_text.append(str(cell_value))
-                
-                if row_text:
-                    content_lines.append('\t'.join(row_text))
+            for index, row in enumerate(worksheet.iter_rows(values_only=True)):
+                # Reading a sheet runs at roughly 70k rows per second, so checking
+                # every 1024th row keeps cancelling within ~15 ms
+                if (index & INTERRUPTION_CHECK_MASK) == 0 and self.isInterruptionRequested():
+                    workbook.close()
+                    return False
                 
-                row_count += 1
-                
-                if row_count % progress_interval == 0:
-                    progress = int((row_count / max_row) * 100)
-                    self.progress_updated.emit(progress)
+                # Filtering, conversion and joining all run in C
+                line = '\t'.join(map(str, filter(is_value, row)))
+                if line or any(map(is_value, row)):
+                    # Keep one entry per line of the joined text, even for
+                    # cells containing line breaks
+                    if '\n' in line:
+                        batch.extend(line.split('\n'))
+                    else:
+                        append(line)
+                    if len(batch) >= EXCEL_BATCH_SIZE:
+                        self.signals.rows_loaded.emit(batch)
+                        batch = []
+                        append = batch.append
             
             workbook.close()
-            return '\n'.join(content_lines)
+            if batch:
+                self.signals.rows_loaded.emit(batch)
+            return True
             
         except Exception as e:
             raise RuntimeError(f"Error reading Excel file: {e}")
     
+    def _detect_encoding(self) -> str:
+        """
+        Guess the encoding of the text file from its first block.
+        
+        Valid UTF-8 is read as such; otherwise charset_normalizer picks the
+        encoding when it is installed, falling back to latin-1.
+        """
+        with open(self.file_path, 'rb') as file:
+            sample = file.read(ENCODING_SAMPLE_SIZE)
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+        
+        # The sample may end inside a multi-byte character; an incremental
+        # decoder keeps such a trailing fragment instead of rejecting it.
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            return 'utf-8-sig'
+        except UnicodeDecodeError:
+            pass
+        
+        try:
+            from charset_normalizer import from_bytes
+        except ImportError:
+            return 'latin-1'
+        
+        best_match = from_bytes(sample, cp_isolation=ENCODING_CANDIDATES).best()
+        return best_match.encoding if best_match else 'latin-1'
+    
     def _read_text_file(self) -> str:
         """Read text/CSV file and return content."""
+        encoding = 'utf-8-sig'
         try:
             file_size = os.path.getsize(self.file_path)
+            encoding = self._detect_encoding()
             
-            if file_size > 1024000:
-                content = ""
-                with open(self.file_path, 'r', encoding='utf-8-sig') as file:
-                    chunk_size = 8192
-                    total_chunks = file_size // chunk_size + 1
-                    chunk_count = 0
+            if file_size > LARGE_FILE_THRESHOLD:
+                parts = []
+                with open(self.file_path, 'r', encoding=encoding, buffering=CHUNK_SIZE) as file:
+                    chars_read = 0
+                    last_progress = 0
                     
                     while True:
                         if self.isInterruptionRequested():
                             return ""
                         
-                        chunk = file.read(chunk_size)
+                        chunk = file.read(CHUNK_SIZE)
                         if not chunk:
                             break
-                        content += chunk
-                        chunk_count += 1
+                        parts.append(chunk)
                         
-                        if chunk_count % 50 == 0:
-                            progress = int((chunk_count / total_chunks) * 100)
-                            self.progress_updated.emit(progress)
+                        # Characters approximate bytes closely enough for progress
+                        chars_read += len(chunk)
+                        progress = min(100, chars_read * 100 // file_size)
+                        if progress != last_progress:
+                            last_progress = progress
+                            self.signals.progress_updated.emit(progress)
+                
+                content = ''.join(parts)
             else:
-                with open(self.file_path, 'r', encoding='utf-8-sig') as file:
+                self.signals.progress_updated.emit(0)
+                with open(self.file_path, 'r', encoding=encoding) as file:
                     content = file.read()
+                self.signals.progress_updated.emit(100)
+            
+            if encoding == 'utf-8-sig' and file_size > MMAP_MIN_SIZE:
+                self.scan_path = self.file_path
             
             return content
             
         except UnicodeDecodeError:
+            # Only reached when the sample did not represent the whole file
+            if encoding == 'latin-1':
+                raise RuntimeError("Could not read file with any encoding")
             try:
                 with open(self.file_path, 'r', encoding='latin-1') as file:
                     content = file.read()
@@ -189,51 +378,414 @@ class FileLoaderThread(QThread):
             raise RuntimeError(f"Could not read file: {e}")
 
 
-class ProcessingThread(QThread):
-    """Thread for processing large datasets asynchronously to prevent GUI freezing."""
+class ProcessingSignals(QObject):
+    """Signals of ProcessingTask."""
     
-    processing_complete = pyqtSignal(list)
+    results_ready = pyqtSignal(list)
+    processing_complete = pyqtSignal()
     error_occurred = pyqtSignal(str)
     progress_updated = pyqtSignal(int)
+
+
+class ProcessingTask(BackgroundTask):
+    """Task for processing large datasets asynchronously to prevent GUI freezing."""
     
-    def __init__(self, extractor, iban_prefix: str, text: str):
+    def __init__(self, extractor, iban_prefix: str, text, executor=None, file_path: str = None):
+        """
+        Args:
+            extractor: The extractor to use.
+            iban_prefix: The IBAN prefix of the bank to filter by.
+            text: The text to process, or a list of its lines.
+            executor: Optional process pool used for large inputs.
+            file_path: Optional UTF-8 file holding the text; when given it is
+                       scanned through a memory map instead of text.
+        """
         super().__init__()
+        self.signals = ProcessingSignals()
         self.extractor = extractor
         self.iban_prefix = iban_prefix
         self.text = text
+        self.executor = executor
+        self.file_path = file_path
     
-    def run(self):
-        """Process the text in a separate thread."""
+    def execute(self):
+        """Process the text in a pooled thread."""
         try:
-            lines = self.text.split('\n')
-            total_lines = len(lines)
+            if self.file_path:
+                self._process_file()
+                return
+            
+            # The task stays referenced after it finishes, so it must not keep
+            # the input alive.
+            text, self.text = self.text, None
+            
+            # Plain text is cut into newline-aligned slices instead of being
+            # split into one string per line.
+            if isinstance(text, str):
+                total_lines = text.count('\n') + 1
+                chunks = self._text_chunks(text)
+            else:
+                total_lines = len(text)
+                chunks = self._line_chunks(text)
             results = []
+            last_progress = -1
+            results_ready = self.signals.results_ready
             
-            for i, line in enumerate(lines):
+            if self.executor is not None and total_lines >= PARALLEL_MIN_LINES:
+                batches = self._process_batches_parallel(chunks)
+            else:
+                batches = self._process_batches(chunks)
+            
+            for line_offset, progress, batch_results in batches:
                 if self.isInterruptionRequested():
+                    batches.close()
                     return
                 
-                line = line.strip()
-                if line:
-                    phone_numbers = self.extractor.extract_phone_numbers(self.iban_prefix, line)
-                    if phone_numbers:
-                        results.append({
-                            'line_number': i + 1,
-                            'text': line,
-                            'phone_numbers': phone_numbers,
-                            'phone_count': len(phone_numbers)
-                        })
+                for result in batch_results:
+                    result['line_number'] += line_offset
+                results.extend(batch_results)
+                if len(results) >= RESULTS_CHUNK_SIZE:
+                    results_ready.emit(results)
+                    results = []
                 
-                if total_lines > 1000 and i % 50 == 0:
-                    progress = int((i / total_lines) * 100)
-                    self.progress_updated.emit(progress)
-                    import time
-                    time.sleep(0.001)
+                # Only report changes, so the GUI queue is not flooded
+                if total_lines > 1000 and progress != last_progress:
+                    last_progress = progress
+                    self.signals.progress_updated.emit(progress)
             
-            self.processing_complete.emit(results)
+            if results:
+                results_ready.emit(results)
+            self.signals.processing_complete.emit()
             
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            self.signals.error_occurred.emit(str(e))
+    
+    def _process_file(self):
+        """Process the file with the memory-mapped scan of the extractor."""
+        def report_progress(percent, bytes_processed, total_bytes):
+            # Raising is the only way to stop the scan early; it only runs
+            # after a whole segment and at most every 50 ms, so a cancel
+            # takes effect at the next report
+            if self.isInterruptionRequested():
+                raise InterruptedError("Processing cancelled")
+            self.signals.progress_updated.emit(int(percent))
+        
+        try:
+            results = self.extractor.process_large_file(
+                self.iban_prefix, self.file_path, progress_callback=report_progress,
+                executor=self.executor
+            )
+        except RuntimeError:
+            if self.isInterruptionRequested():
+                return
+            raise
+        
+        if not self.isInterruptionRequested():
+            if results:
+                self.signals.results_ready.emit(results)
+            self.signals.processing_complete.emit()
+    
+    @staticmethod
+    def _text_chunks(text: str):
+        """Yield (line_offset, progress, chunk) for newline-aligned slices of the text."""
+        start = 0
+        line_offset = 0
+        while True:
+            end = text.find('\n', start + PROCESSING_BATCH_CHARS)
+            if end < 0:
+                end = len(text)
+            yield line_offset, int((end / max(1, len(text))) * 100), text[start:end]
+            if end >= len(text):
+                break
+            line_offset += text.count('\n', start, end) + 1
+            start = end + 1
+    
+    @staticmethod
+    def _line_chunks(lines: list):
+        """Yield (line_offset, progress, chunk) for batches of the given lines."""
+        for start in range(0, len(lines), PROCESSING_BATCH_SIZE):
+            end = min(start + PROCESSING_BATCH_SIZE, len(lines))
+            yield start, int((end / len(lines)) * 100), '\n'.join(lines[start:end])
+    
+    def _process_batches(self, chunks):
+        """Yield (line_offset, progress, results) for each chunk, in this thread."""
+        process_text = self.extractor.process_text
+        iban_prefix = self.iban_prefix
+        for line_offset, progress, chunk in chunks:
+            yield line_offset, progress, process_text(iban_prefix, chunk)
+    
+    def _process_batches_parallel(self, chunks):
+        """Yield (line_offset, progress, results) for each chunk, in order, from the process pool."""
+        # Only a few chunks per worker are in flight so the pickled copies
+        # of the input stay small.
+        max_pending = 4 * (os.cpu_count() or 1)
+        pending = deque()
+        try:
+            for line_offset, progress, chunk in chunks:
+                pending.append((line_offset, progress, self.executor.submit(
+                    _process_text_batch, self.iban_prefix, chunk
+                )))
+                if len(pending) >= max_pending:
+                    line_offset, progress, future = pending.popleft()
+                    yield line_offset, progress, future.result()
+            while pending:
+                line_offset, progress, future = pending.popleft()
+                yield line_offset, progress, future.result()
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+
+class ExportSignals(QObject):
+    """Signals of ExportTask."""
+    
+    export_complete = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    progress_updated = pyqtSignal(int)
+
+
+class ExportTask(BackgroundTask):
+    """Task for writing extraction results to a file without blocking the GUI."""
+    
+    def __init__(self, results: list, file_path: str):
+        """
+        Args:
+            results: The results to export; the list is not modified while
+                     the task runs, as new results replace it.
+            file_path: The file to write; .xlsx files are written as Excel
+                       workbooks, .csv files as one row per result and
+                       anything else as one phone number per line.
+        """
+        super().__init__()
+        self.signals = ExportSignals()
+        self.results = results
+        self.file_path = file_path
+    
+    def execute(self):
+        """Write the file in a pooled thread."""
+        try:
+            file_extension = os.path.splitext(self.file_path)[1].lower()
+            if file_extension == '.xlsx':
+                completed = self._export_to_excel()
+            elif file_extension == '.csv':
+                completed = self._export_to_csv()
+            else:
+                completed = self._export_to_text()
+            
+            if completed:
+                self.signals.progress_updated.emit(100)
+                self.signals.export_complete.emit(self.file_path)
+                
+        except Exception as e:
+            self.signals.error_occurred.emit(str(e))
+    
+    def _export_to_excel(self) -> bool:
+        """
+        Export results to Excel file.
+        
+        Returns:
+            True if the file was written, False if the export was interrupted.
+        """
+        try:
+            from openpyxl import Workbook
+            from openpyxl.utils import get_column_letter
+        except ImportError:
+            raise RuntimeError("openpyxl is required to export Excel files. Please install it with: pip install openpyxl")
+        
+        headers = ("Line Number", "Original Text", "Phone Numbers")
+        results = self.results
+        
+        # A write-only workbook streams rows to the file instead of keeping a
+        # cell grid; its column widths must be set before the first row, so
+        # they are taken from the leading results only.
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Extracted Phone Numbers")
+        sample = [self._excel_row(result) for result in results[:EXCEL_WIDTH_SAMPLE_ROWS]]
+        for col_idx, header in enumerate(headers):
+            max_length = max(len(header), max(map(len, (row[col_idx] for row in sample)), default=0))
+            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
+            worksheet.column_dimensions[get_column_letter(col_idx + 1)].width = adjusted_width
+        
+        worksheet.append(headers)
+        total = len(results)
+        for index, result in enumerate(results):
+            if (index & INTERRUPTION_CHECK_MASK) == 0:
+                if self.isInterruptionRequested():
+                    # Finish the streamed sheet so nothing writes to it later
+                    worksheet.close()
+                    workbook.close()
+                    return False
+                self.signals.progress_updated.emit(index * 100 // total)
+            worksheet.append(self._excel_row(result))
+        
+        # Save the workbook
+        workbook.save(self.file_path)
+        workbook.close()
+        return True
+    
+    @staticmethod
+    def _excel_row(result: dict) -> tuple:
+        """Return the cells of the Excel row of a result."""
+        return str(result['line_number']), result['text'], ', '.join(result['phone_numbers'])
+    
+    def _export_to_csv(self) -> bool:
+        """
+        Export results to CSV file, with the same columns as the Excel export.
+        
+        Returns:
+            True if the file was written, False if the export was interrupted.
+        """
+        results = self.results
+        total = len(results)
+        batch_size = INTERRUPTION_CHECK_MASK + 1
+        with open(self.file_path, 'w', encoding='utf-8', newline='', buffering=EXPORT_BUFFER_SIZE) as file:
+            writer = csv.writer(file)
+            writer.writerow(("Line Number", "Original Text", "Phone Numbers"))
+            for start in range(0, total, batch_size):
+                if self.isInterruptionRequested():
+                    break
+                self.signals.progress_updated.emit(start * 100 // total)
+                
+                writer.writerows(
+                    (result['line_number'], result['text'], ', '.join(result['phone_numbers']))
+                    for result in results[start:start + batch_size]
+                )
+            else:
+                return True
+        
+        # Do not leave a partial export behind
+        os.remove(self.file_path)
+        return False
+    
+    def _export_to_text(self) -> bool:
+        """
+        Export results to text file, one phone number per line.
+        
+        Returns:
+            True if the file was written, False if the export was interrupted.
+        """
+        results = self.results
+        total = len(results)
+        batch_size = INTERRUPTION_CHECK_MASK + 1
+        with open(self.file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as file:
+            for start in range(0, total, batch_size):
+                if self.isInterruptionRequested():
+                    break
+                self.signals.progress_updated.emit(start * 100 // total)
+                
+                # Write each phone number on a separate line, one write per batch
+                phones = [phone for result in results[start:start + batch_size] for phone in result['phone_numbers']]
+                if phones:
+                    file.write('\n'.join(phones) + '\n')
+            else:
+                return True
+        
+        # Do not leave a partial export behind
+        os.remove(self.file_path)
+        return False
+
+
+class ResultsModel(QAbstractTableModel):
+    """Table model serving extraction results straight from the result list."""
+    
+    HEADERS = ("Line", "Text", "Phone Numbers")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results = []
+        # Joined phone numbers of each row, filled in as rows are shown
+        self._phones_text = []
+    
+    @property
+    def results(self) -> list:
+        """The results currently shown."""
+        return self._results
+    
+    def set_results(self, results: list):
+        """Replace the shown results."""
+        self.beginResetModel()
+        self._results = results
+        self._phones_text = [None] * len(results)
+        self.endResetModel()
+    
+    def append_results(self, results: list):
+        """Add results after the shown ones."""
+        if not results:
+            return
+        first = len(self._results)
+        self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+        self._results.extend(results)
+        self._phones_text.extend([None] * len(results))
+        self.endInsertRows()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._results)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            # Served as an int; the view's delegate formats it in C++
+            return self._results[row]['line_number']
+        if column == 1:
+            return self._results[row]['text']
+        
+        # Views ask for the same cells on every repaint
+        phones_text = self._phones_text[row]
+        if phones_text is None:
+            phones_text = self._phones_text[row] = ', '.join(self._results[row]['phone_numbers'])
+        return phones_text
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class BanksModel(QAbstractTableModel):
+    """Table model serving bank rows straight from the registry tuples."""
+    
+    HEADERS = ("Entity Code", "Bank Name", "IBAN Prefix", "Address")
+    
+    # Position in the (iban_prefix, name, entity_code, address) tuples of
+    # the value shown in each column
+    _FIELDS = (2, 1, 0, 3)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._banks = []
+    
+    def set_banks(self, banks: list):
+        """Replace the shown banks with (iban_prefix, name, entity_code, address) tuples."""
+        self.beginResetModel()
+        self._banks = banks
+        self.endResetModel()
+    
+    def iban_prefix(self, row: int) -> str:
+        """Return the IBAN prefix of the bank in the given row."""
+        return self._banks[row][0]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._banks)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._banks[index.row()][self._FIELDS[index.column()]]
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class SpanishBankGUI(QMainWindow):
@@ -242,6 +794,14 @@ class SpanishBankGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.extractor = SpanishBankExtractor()
+        # The bank registry is loaded once, so lookups can be memoized for
+        # the lifetime of the window
+        self._get_bank_info = lru_cache(maxsize=4096)(self.extractor.get_bank_info)
+        self._ui_state = UIState.IDLE
+        # Background tasks of the last load, extraction and export
+        self.file_loader = None
+        self.processing_task = None
+        self.export_task = None
         self.init_ui()
         self.setup_styles()
     
@@ -262,7 +822,7 @@ class SpanishBankGUI(QMainWindow):
         main_layout.addWidget(header)
         
         self.tab_widget = QTabWidget()
-        self.tab_widget.setFont(QFont("Segoe UI", 10))
+        self.tab_widget.setFont(_font("Segoe UI", 10))
         
         self.tab_widget.addTab(self.create_extraction_tab(), "Phone Extraction")
         self.tab_widget.addTab(self.create_bank_info_tab(), "Bank Information")
@@ -276,13 +836,13 @@ class SpanishBankGUI(QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 0)
         
         title_label = QLabel("Spanish Bank Phone Number Extractor")
-        title_label.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        title_label.setFont(_font("Segoe UI", 24, QFont.Weight.Bold))
         title_label.setProperty("class", "title")
         title_label.setStyleSheet("margin-bottom: 8px;")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         subtitle_label = QLabel("Extract phone numbers from Spanish bank IBAN data")
-        subtitle_label.setFont(QFont("Segoe UI", 12))
+        subtitle_label.setFont(_font("Segoe UI", 12))
         subtitle_label.setProperty("class", "subtitle")
         subtitle_label.setStyleSheet("margin-bottom: 16px;")
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -321,12 +881,15 @@ class SpanishBankGUI(QMainWindow):
         self.bank_combo = QComboBox()
         self.bank_combo.setMinimumHeight(40)
         self.bank_combo.setMinimumWidth(300)
-        self.bank_combo.setFont(QFont("Segoe UI", 10))
+        self.bank_combo.setFont(_font("Segoe UI", 10))
         
         major_banks = self.extractor.get_major_banks()
-        self.bank_combo.addItem("Select a bank...", None)
-        for iban_prefix, display_name in major_banks:
-            self.bank_combo.addItem(display_name, iban_prefix)
+        self.bank_combo.addItems(["Select a bank...", *(display_name for _, display_name in major_banks)])
+        set_item_data = self.bank_combo.setItemData
+        for index, (iban_prefix, _) in enumerate(major_banks, 1):
+            set_item_data(index, iban_prefix)
+        # Combo box index of each listed IBAN prefix
+        self._bank_combo_indexes = {iban_prefix: index for index, (iban_prefix, _) in enumerate(major_banks, 1)}
         
         self.search_button = ModernButton("Search All Banks", primary=False)
         self.search_button.clicked.connect(self.show_bank_search_dialog)
@@ -337,7 +900,7 @@ class SpanishBankGUI(QMainWindow):
         controls_layout.addStretch()
         
         self.bank_info_label = QLabel()
-        self.bank_info_label.setFont(QFont("Segoe UI", 10))
+        self.bank_info_label.setFont(_font("Segoe UI", 10))
         self.bank_info_label.setProperty("class", "info")
         self.bank_info_label.setVisible(False)
         
@@ -372,8 +935,8 @@ class SpanishBankGUI(QMainWindow):
         controls_layout.addWidget(self.cancel_button)
         controls_layout.addStretch()
         
-        self.input_text = QTextEdit()
-        self.input_text.setFont(QFont("Consolas", 10))
+        self.input_text = QPlainTextEdit()
+        self.input_text.setFont(_font("Consolas", 10))
         self.input_text.setStyleSheet("line-height: 1.4; padding: 12px;")
         self.input_text.setPlaceholderText("Paste your data with Spanish IBANs and phone numbers here...")
         
@@ -383,19 +946,6 @@ class SpanishBankGUI(QMainWindow):
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #404040;
-                border-radius: 6px;
-                background-color: #2d2d30;
-                color: #ffffff;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                border-radius: 5px;
-            }
-        """)
         
         layout.addLayout(controls_layout)
         layout.addWidget(self.input_text)
@@ -411,14 +961,20 @@ class SpanishBankGUI(QMainWindow):
         layout.setSpacing(12)
         
         # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(3)
-        self.results_table.setHorizontalHeaderLabels(["Line", "Text", "Phone Numbers"])
+        self.results_model = ResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        # Line numbers are served as ints; show them without group separators
+        locale = QLocale()
+        locale.setNumberOptions(QLocale.NumberOption.OmitGroupSeparator)
+        self.results_table.setLocale(locale)
         header = self.results_table.horizontalHeader()
         if header:
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+            # Sized once per result set by _resize_result_columns, since
+            # ResizeToContents would measure again on every inserted chunk
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
             header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+            header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
         
         # Results controls
         controls_layout = QHBoxLayout()
@@ -436,7 +992,7 @@ class SpanishBankGUI(QMainWindow):
         
         # Results summary
         self.results_summary = QLabel()
-        self.results_summary.setFont(QFont("Segoe UI", 10))
+        self.results_summary.setFont(_font("Segoe UI", 10))
         self.results_summary.setProperty("class", "info")
         
         controls_layout.addWidget(self.export_button)
@@ -456,13 +1012,13 @@ class SpanishBankGUI(QMainWindow):
         layout.setSpacing(20)
         
         title_label = QLabel("Spanish Bank Registry")
-        title_label.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
+        title_label.setFont(_font("Segoe UI", 18, QFont.Weight.Bold))
         title_label.setProperty("class", "title")
         title_label.setStyleSheet("margin-bottom: 16px;")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         instructions_label = QLabel("Double-click a bank to select it")
-        instructions_label.setFont(QFont("Segoe UI", 10))
+        instructions_label.setFont(_font("Segoe UI", 10))
         instructions_label.setProperty("class", "subtitle")
         instructions_label.setStyleSheet("margin-bottom: 16px; color: #605e5c;")
         instructions_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -472,9 +1028,19 @@ class SpanishBankGUI(QMainWindow):
         
         self.bank_search_input = QLineEdit()
         self.bank_search_input.setMinimumHeight(40)
-        self.bank_search_input.setFont(QFont("Segoe UI", 10))
+        self.bank_search_input.setFont(_font("Segoe UI", 10))
         self.bank_search_input.setPlaceholderText("Search banks by name...")
         
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.search_banks)
+        # Search term whose matches the banks table shows, "" for all banks
+        self._banks_search_term = None
+        self._all_banks = None
+        self.bank_search_input.textChanged.connect(self._search_timer.start)
+        self.bank_search_input.returnPressed.connect(self.search_banks)
+        
         self.search_banks_button = ModernButton("Search", primary=True)
         self.search_banks_button.clicked.connect(self.search_banks)
         
@@ -482,10 +1048,10 @@ class SpanishBankGUI(QMainWindow):
         search_layout.addWidget(self.bank_search_input)
         search_layout.addWidget(self.search_banks_button)
         
-        self.banks_table = QTableWidget()
+        self.banks_model = BanksModel(self)
+        self.banks_table = QTableView()
         self.banks_table.setObjectName("banks_table")
-        self.banks_table.setColumnCount(4)
-        self.banks_table.setHorizontalHeaderLabels(["Entity Code", "Bank Name", "IBAN Prefix", "Address"])
+        self.banks_table.setModel(self.banks_model)
         bank_header = self.banks_table.horizontalHeader()
         if bank_header:
             bank_header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
@@ -493,7 +1059,7 @@ class SpanishBankGUI(QMainWindow):
             bank_header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
             bank_header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
         
-        self.banks_table.itemDoubleClicked.connect(self.on_bank_table_double_clicked)
+        self.banks_table.doubleClicked.connect(self.on_bank_table_double_clicked)
         
         self.load_all_banks_button = ModernButton("Load All Banks", primary=True)
         self.load_all_banks_button.clicked.connect(self.load_all_banks)
@@ -508,265 +1074,33 @@ class SpanishBankGUI(QMainWindow):
     
     def setup_styles(self):
         """Setup application-wide styles."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                color: #ffffff;
-                min-width: 800px;
-                min-height: 600px;
-            }
-            
-            QWidget {
-                color: #ffffff;
-                background-color: #1e1e1e;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #404040;
-                border-radius: 8px;
-                background-color: #2d2d30;
-                margin-top: -1px;
-            }
-            
-            QTabBar::tab {
-                background-color: #3e3e42;
-                border: 1px solid #404040;
-                border-bottom: none;
-                padding: 12px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-weight: 500;
-                color: #cccccc;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #2d2d30;
-                border-bottom: 1px solid #2d2d30;
-                font-weight: 600;
-                color: #ffffff;
-            }
-            
-            QTabBar::tab:hover {
-                background-color: #505050;
-                color: #ffffff;
-            }
-            
-            QLabel {
-                color: #ffffff;
-                background-color: transparent;
-            }
-            
-            QTextEdit {
-                border: 1px solid #404040;
-                border-radius: 6px;
-                padding: 8px;
-                background-color: #2d2d30;
-                color: #ffffff;
-                selection-background-color: #0078d4;
-                selection-color: white;
-                min-height: 100px;
-            }
-            
-            QLineEdit {
-                border: 1px solid #404040;
-                border-radius: 6px;
-                padding: 8px 12px;
-                background-color: #2d2d30;
-                color: #ffffff;
-                selection-background-color: #0078d4;
-                selection-color: white;
-                min-height: 20px;
-            }
-            
-            QTextEdit:focus, QLineEdit:focus {
-                border-color: #0078d4;
-                outline: none;
-                color: #ffffff;
-            }
-            
-            QComboBox {
-                border: 1px solid #404040;
-                border-radius: 6px;
-                padding: 8px 12px;
-                background-color: #2d2d30;
-                color: #ffffff;
-                min-height: 20px;
-            }
-            
-            QComboBox:focus {
-                border-color: #0078d4;
-                color: #ffffff;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #cccccc;
-                margin-right: 8px;
-            }
-            
-            QComboBox QAbstractItemView {
-                border: 1px solid #404040;
-                background-color: #2d2d30;
-                color: #ffffff;
-                selection-background-color: #0078d4;
-                selection-color: white;
-                border-radius: 4px;
-            }
-            
-            QComboBox QAbstractItemView::item {
-                color: #ffffff;
-                padding: 8px;
-            }
-            
-            QComboBox QAbstractItemView::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            
-            QComboBox QAbstractItemView::item:hover {
-                background-color: #505050;
-                color: #ffffff;
-            }
-            
-            QTableWidget {
-                border: 1px solid #404040;
-                border-radius: 8px;
-                background-color: #2d2d30;
-                color: #ffffff;
-                gridline-color: #404040;
-                alternate-background-color: #252526;
-                min-height: 200px;
-            }
-            
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #404040;
-                color: #ffffff;
-                background-color: transparent;
-            }
-            
-            QTableWidget::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            
-            QTableWidget::item:alternate {
-                background-color: #252526;
-                color: #ffffff;
-            }
-            
-            /* Make bank table rows look clickable */
-            QTableWidget#banks_table::item:hover {
-                background-color: #3e3e42;
-                color: #ffffff;
-            }
-            
-            QTableWidget#banks_table::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            
-            QHeaderView::section {
-                background-color: #3e3e42;
-                padding: 12px 8px;
-                border: none;
-                border-bottom: 1px solid #404040;
-                font-weight: 600;
-                color: #ffffff;
-            }
-            
-            QScrollBar:vertical {
-                background-color: #3e3e42;
-                width: 12px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #505050;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #707070;
-            }
-            
-            QScrollBar:horizontal {
-                background-color: #3e3e42;
-                height: 12px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:horizontal {
-                background-color: #505050;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            
-            QScrollBar::handle:horizontal:hover {
-                background-color: #707070;
-            }
-            
-            /* Ensure all text elements have proper colors */
-            QLabel, QTextEdit, QLineEdit, QComboBox, QTableWidget, QHeaderView {
-                color: #ffffff;
-            }
-            
-            /* Specific styling for different text elements */
-            QLabel[class="title"] {
-                color: #ffffff;
-                font-weight: bold;
-            }
-            
-            QLabel[class="subtitle"] {
-                color: #cccccc;
-            }
-            
-            QLabel[class="info"] {
-                color: #cccccc;
-                background-color: #3e3e42;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """)
+        # Applied to the application once; later windows share the parsed sheet
+        app = QApplication.instance()
+        stylesheet = _load_stylesheet()
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
     
     def on_bank_selected(self, index: int):
         """Handle bank selection."""
-        if index > 0:
-            iban_prefix = self.bank_combo.currentData()
-            if iban_prefix:
-                # Always use normalized prefix for extractor
-                normalized_prefix = self.extractor.normalize_iban_prefix(iban_prefix)
-                bank_info = self.extractor.get_bank_info(normalized_prefix)
-                if bank_info:
-                    self.bank_info_label.setText(
-                        f"Selected: {bank_info['name']} ({bank_info['entity_code']})"
-                    )
-                    self.bank_info_label.setVisible(True)
-                    self.process_button.setEnabled(True)
-                    self.selected_bank_prefix = normalized_prefix  # Store for use in process_input
-                else:
-                    self.bank_info_label.setVisible(False)
-                    self.process_button.setEnabled(False)
-                    self.selected_bank_prefix = None
-            else:
-                self.bank_info_label.setVisible(False)
-                self.process_button.setEnabled(False)
-                self.selected_bank_prefix = None
+        self._select_bank(self.bank_combo.currentData() if index > 0 else None)
+    
+    def _select_bank(self, iban_prefix):
+        """Make the given bank the one to extract for, or clear the selection if None."""
+        bank_info = None
+        if iban_prefix:
+            # Always use normalized prefix for extractor
+            normalized_prefix = self.extractor.normalize_iban_prefix(iban_prefix)
+            bank_info = self._get_bank_info(normalized_prefix)
+        
+        if bank_info:
+            self.bank_info_label.setText(
+                f"Selected: {bank_info['name']} ({bank_info['entity_code']})"
+            )
+            self.selected_bank_prefix = normalized_prefix  # Store for use in process_input
         else:
-            self.bank_info_label.setVisible(False)
-            self.process_button.setEnabled(False)
             self.selected_bank_prefix = None
+        self.bank_info_label.setVisible(bank_info is not None)
+        self.process_button.setEnabled(bank_info is not None and self._ui_state is UIState.IDLE)
     
     def show_bank_search_dialog(self):
         """Show bank search dialog."""
@@ -800,83 +1134,113 @@ class SpanishBankGUI(QMainWindow):
                 if reply == QMessageBox.StandardButton.No:
                     return
             
-            # Show loading cursor and progress bar
-            self.setCursor(Qt.CursorShape.WaitCursor)
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(0)
-            self.progress_bar.setFormat("Loading file... %p%")
-            
-            # Disable buttons during loading
-            self.process_button.setEnabled(False)
-            self.file_button.setEnabled(False)
-            self.cancel_button.setVisible(True) # Show cancel button
+            self._set_ui_state(UIState.LOADING)
             
             # Determine file type and read accordingly
             file_extension = os.path.splitext(file_name)[1].lower()
             
+            # Excel rows arrive in batches and are appended to the input
+            if file_extension in ['.xlsx', '.xls']:
+                self.input_text.clear()
+                self.input_text.setReadOnly(False)
+                self._loaded_lines = []
+                self._loaded_file = None
+                self._loaded_text = None
+            
             # Create and start the file loader thread
-            self.file_loader = FileLoaderThread(file_name, file_extension)
-            self.file_loader.file_loaded.connect(self.on_file_loaded)
-            self.file_loader.error_occurred.connect(self.on_file_error)
-            self.file_loader.progress_updated.connect(self.update_progress_bar)
+            self.file_loader = FileLoaderTask(file_name, file_extension)
+            signals = self.file_loader.signals
+            signals.file_loaded.connect(self.on_file_loaded)
+            signals.rows_loaded.connect(self.on_rows_loaded)
+            signals.rows_complete.connect(self.on_rows_complete)
+            signals.error_occurred.connect(self.on_file_error)
+            signals.progress_updated.connect(self.update_progress_bar)
             self.file_loader.start()
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not read file: {e}")
-            self.progress_bar.setVisible(False)
-            self.process_button.setEnabled(False)
-            self.file_button.setEnabled(True)
-            self.cancel_button.setVisible(False)
+            self._set_ui_state(UIState.IDLE)
     
     def on_file_loaded(self, content: str):
         """Handle file loading completion."""
-        self.input_text.setPlainText(content)
-        
-        # Restore UI state
-        self.setCursor(Qt.CursorShape.ArrowCursor)
-        self.progress_bar.setVisible(False)
-        self.process_button.setEnabled(True)
-        self.file_button.setEnabled(True)
-        self.cancel_button.setVisible(False)
-        
+        # Large files are processed from the loaded string; laying out all
+        # of it in the input area would only cost time and memory.
+        is_preview = len(content) > PREVIEW_MIN_CHARS
+        if is_preview:
+            preview_end = 0
+            for _ in range(PREVIEW_LINES):
+                preview_end = content.find('\n', preview_end) + 1
+                if not preview_end:
+                    is_preview = False
+                    break
+        self.input_text.setPlainText(content[:preview_end - 1] if is_preview else content)
+        self.input_text.setReadOnly(is_preview)
+        self.input_text.document().setModified(False)
+        self._loaded_lines = None
+        # Files scanned from disk do not need their decoded text kept around
+        self._loaded_file = self.file_loader.scan_path
+        self._loaded_text = None if self._loaded_file else content
+        self._finish_file_loading(len(content), is_preview)
+    
+    def on_rows_loaded(self, rows: list):
+        """Append a batch of loaded Excel rows to the input text area."""
+        shown = PREVIEW_LINES - len(self._loaded_lines)
+        if shown > 0:
+            cursor = QTextCursor(self.input_text.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(('\n' if self._loaded_lines else '') + '\n'.join(rows[:shown]))
+        self._loaded_lines.extend(rows)
+    
+    def on_rows_complete(self):
+        """Handle Excel loading completion."""
+        # Rows are processed directly as long as the input is not edited
+        is_preview = len(self._loaded_lines) > PREVIEW_LINES
+        self.input_text.setReadOnly(is_preview)
+        self.input_text.document().setModified(False)
+        self._finish_file_loading(self.input_text.document().characterCount(), is_preview)
+    
+    def _finish_file_loading(self, content_length: int, is_preview: bool = False):
+        """Restore the UI after a file has been loaded."""
         # Clear previous results
-        self.export_button.setEnabled(False)  # No results yet
-        self.clear_results_button.setEnabled(False)
-        self.results_summary.clear()
-        self.results_table.setRowCount(0)
+        self._clear_results_view()
+        self._set_ui_state(UIState.IDLE)
         
         # Show success message for large files
-        if len(content) > 100000:  # More than 100KB
+        if is_preview:
+            QMessageBox.information(
+                self, "Success",
+                f"File loaded successfully!\n\nOnly the first {PREVIEW_LINES:,} lines are shown; "
+                "the whole file will be processed."
+            )
+        elif content_length > 100000:  # More than 100KB
             QMessageBox.information(self, "Success", "File loaded successfully!")
     
     def on_file_error(self, error_message: str):
         """Handle file loading errors."""
         QMessageBox.critical(self, "Error", f"Failed to load file: {error_message}")
         
-        # Restore UI state
-        self.setCursor(Qt.CursorShape.ArrowCursor)
-        self.progress_bar.setVisible(False)
-        self.process_button.setEnabled(False)
-        self.file_button.setEnabled(True)
-        self.cancel_button.setVisible(False)
-        self.export_button.setEnabled(False)
-        self.clear_results_button.setEnabled(False)
-        self.results_summary.clear()
-        self.results_table.setRowCount(0)
+        self._clear_results_view()
+        self._set_ui_state(UIState.IDLE)
     
     def update_progress_bar(self, progress: int):
-        """Update the progress bar during file loading."""
+        """Update the progress bar during file loading; -1 means indeterminate."""
         if hasattr(self, 'progress_bar') and self.progress_bar.isVisible():
+            if progress < 0:
+                self.progress_bar.setRange(0, 0)
+                return
             # Only update if progress actually changed to reduce UI overhead
+            # The reports arrive as queued signals, so the event loop repaints
+            # on its own between them.
             if self.progress_bar.value() != progress:
                 self.progress_bar.setValue(progress)
-                # Process events less frequently to maintain responsiveness
-                if progress % 5 == 0:  # Only process events every 5% progress
-                    QApplication.processEvents()
     
     def clear_input(self):
         """Clear input text area."""
         self.input_text.clear()
+        self.input_text.setReadOnly(False)
+        self._loaded_lines = None
+        self._loaded_file = None
+        self._loaded_text = None
     
     def process_input(self):
         """Process input text to extract phone numbers."""
@@ -884,7 +1248,25 @@ class SpanishBankGUI(QMainWindow):
         if not iban_prefix:
             QMessageBox.warning(self, "Warning", "Please select a bank first.")
             return
-        text = self.input_text.toPlainText()
+        
+        # Process loaded content directly unless the input was edited since
+        text = None
+        if not self.input_text.document().isModified():
+            loaded_lines = getattr(self, '_loaded_lines', None)
+            if loaded_lines:
+                self._process_large_dataset(iban_prefix, loaded_lines)
+                return
+            
+            # Large text files are scanned from the file itself
+            loaded_file = getattr(self, '_loaded_file', None)
+            if loaded_file:
+                self._process_large_dataset(iban_prefix, None, loaded_file)
+                return
+            
+            text = getattr(self, '_loaded_text', None)
+        
+        if text is None:
+            text = self.input_text.toPlainText()
         if not text.strip():
             QMessageBox.warning(self, "Warning", "Please enter some text to process.")
             return
@@ -897,25 +1279,38 @@ class SpanishBankGUI(QMainWindow):
             # Use synchronous processing for smaller datasets
             self._process_small_dataset(iban_prefix, text)
     
-    def _process_large_dataset(self, iban_prefix: str, text: str):
-        """Process large datasets asynchronously."""
-        # Show processing cursor and progress bar
-        self.setCursor(Qt.CursorShape.WaitCursor)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setFormat("Processing data... %p%")
-        
-        # Disable buttons during processing
-        self.process_button.setEnabled(False)
-        self.file_button.setEnabled(False)
-        self.cancel_button.setVisible(True) # Show cancel button
+    def _process_large_dataset(self, iban_prefix: str, text, file_path: str = None):
+        """Process large datasets asynchronously, from the text or from file_path if given."""
+        # Results are added in chunks as they are found
+        self._clear_results_view()
+        self._set_ui_state(UIState.PROCESSING)
         
         # Create and start the processing thread
-        self.processing_thread = ProcessingThread(self.extractor, iban_prefix, text)
-        self.processing_thread.processing_complete.connect(self.on_processing_complete)
-        self.processing_thread.error_occurred.connect(self.on_processing_error)
-        self.processing_thread.progress_updated.connect(self.update_progress_bar)
-        self.processing_thread.start()
+        self.processing_task = ProcessingTask(
+            self.extractor, iban_prefix, text, self._get_process_pool(), file_path
+        )
+        signals = self.processing_task.signals
+        signals.results_ready.connect(self.on_results_ready)
+        signals.processing_complete.connect(self.on_processing_complete)
+        signals.error_occurred.connect(self.on_processing_error)
+        signals.progress_updated.connect(self.update_progress_bar)
+        self.processing_task.start()
+    
+    def _get_process_pool(self):
+        """Return the worker process pool, created on first use, or None on a single CPU."""
+        if (os.cpu_count() or 1) < 2:
+            return None
+        if getattr(self, '_process_pool', None) is None:
+            # Spawned, as forking this multithreaded process can deadlock the workers
+            self._process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+        return self._process_pool
+    
+    def closeEvent(self, event):
+        """Shut down the worker process pool when the window closes."""
+        if getattr(self, '_process_pool', None) is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        super().closeEvent(event)
     
     def _process_small_dataset(self, iban_prefix: str, text: str):
         """Process small datasets synchronously."""
@@ -933,16 +1328,21 @@ class SpanishBankGUI(QMainWindow):
             # Restore cursor
             self.setCursor(Qt.CursorShape.ArrowCursor)
     
-    def on_processing_complete(self, results):
+    def on_results_ready(self, results: list):
+        """Show a chunk of results while processing continues."""
+        # Chunks still queued from a cancelled task are dropped
+        task = self.processing_task
+        if self.sender() is task.signals and not task.isInterruptionRequested():
+            first_chunk = self.results_model.rowCount() == 0
+            self.results_model.append_results(results)
+            if first_chunk:
+                self._resize_result_columns()
+    
+    def on_processing_complete(self):
         """Handle processing completion."""
-        self.display_results(results)
-        
-        # Restore UI state
-        self.setCursor(Qt.CursorShape.ArrowCursor)
-        self.progress_bar.setVisible(False)
-        self.process_button.setEnabled(True)
-        self.file_button.setEnabled(True)
-        self.cancel_button.setVisible(False)
+        results = self.results_model.results
+        self._update_results_summary()
+        self._set_ui_state(UIState.IDLE)
         
         # Show success message for large datasets
         if len(results) > 100:
@@ -950,44 +1350,20 @@ class SpanishBankGUI(QMainWindow):
     
     def on_processing_error(self, error_message: str):
         """Handle processing errors."""
+        # Drop the results shown before the error
+        self._clear_results_view()
+        self._set_ui_state(UIState.IDLE)
         QMessageBox.critical(self, "Error", f"Error processing data: {error_message}")
-        
-        # Restore UI state
-        self.setCursor(Qt.CursorShape.ArrowCursor)
-        self.progress_bar.setVisible(False)
-        self.process_button.setEnabled(True)
-        self.file_button.setEnabled(True)
-        self.cancel_button.setVisible(False)
     
     def display_results(self, results):
         """Display results in the table."""
-        # Block signals for better performance
-        self.results_table.blockSignals(True)
-        
-        self.results_table.setRowCount(len(results))
-        
-        total_phones = 0
-        for i, result in enumerate(results):
-            # Line number
-            line_item = QTableWidgetItem(str(result['line_number']))
-            line_item.setFlags(line_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.results_table.setItem(i, 0, line_item)
-            
-            # Text
-            text_item = QTableWidgetItem(result['text'])
-            text_item.setFlags(text_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.results_table.setItem(i, 1, text_item)
-            
-            # Phone numbers
-            phones_text = ', '.join(result['phone_numbers'])
-            phones_item = QTableWidgetItem(phones_text)
-            phones_item.setFlags(phones_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.results_table.setItem(i, 2, phones_item)
-            
-            total_phones += len(result['phone_numbers'])
-        
-        # Unblock signals
-        self.results_table.blockSignals(False)
+        self.results_model.set_results(results)
+        self._update_results_summary()
+    
+    def _update_results_summary(self):
+        """Show the number of results and enable the result buttons."""
+        results = self.results_model.results
+        total_phones = sum(result['phone_count'] for result in results)
         
         # Update summary
         self.results_summary.setText(f"Found {len(results)} lines with {total_phones} phone numbers")
@@ -995,6 +1371,12 @@ class SpanishBankGUI(QMainWindow):
         # Enable buttons
         self.export_button.setEnabled(len(results) > 0)
         self.clear_results_button.setEnabled(len(results) > 0)
+        self._resize_result_columns()
+    
+    def _resize_result_columns(self):
+        """Fit the line and phone number columns to the current results."""
+        self.results_table.resizeColumnToContents(0)
+        self.results_table.resizeColumnToContents(2)
     
     def export_results(self):
         """Export results to a file."""
@@ -1006,187 +1388,124 @@ class SpanishBankGUI(QMainWindow):
         )
         
         if file_name:
-            try:
-                # Show saving cursor
-                self.setCursor(Qt.CursorShape.WaitCursor)
-                
-                # Determine file type and export accordingly
-                file_extension = os.path.splitext(file_name)[1].lower()
-                
-                if file_extension == '.xlsx':
-                    self._export_to_excel(file_name)
-                else:
-                    self._export_to_text(file_name)
-                
-                QMessageBox.information(self, "Success", f"Phone numbers exported to {file_name}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not export results: {e}")
-            finally:
-                # Restore cursor
-                self.setCursor(Qt.CursorShape.ArrowCursor)
+            self._set_ui_state(UIState.EXPORTING)
+            
+            # The task writes from the result list, never from the table
+            self.export_task = ExportTask(self.results_model.results, file_name)
+            signals = self.export_task.signals
+            signals.export_complete.connect(self.on_export_complete)
+            signals.error_occurred.connect(self.on_export_error)
+            signals.progress_updated.connect(self.update_progress_bar)
+            self.export_task.start()
     
-    def _export_to_excel(self, file_path: str):
-        """Export results to Excel file."""
-        try:
-            import openpyxl
-            from openpyxl import Workbook
-            from openpyxl.utils import get_column_letter
-        except ImportError:
-            raise RuntimeError("openpyxl is required to export Excel files. Please install it with: pip install openpyxl")
-        
-        # Create a new workbook
-        workbook = Workbook()
-        worksheet = workbook.active
-        if worksheet is None:
-            # Create a new worksheet if none exists
-            worksheet = workbook.create_sheet("Extracted Phone Numbers")
-        else:
-            worksheet.title = "Extracted Phone Numbers"
-        
-        # Add headers
-        worksheet['A1'] = "Line Number"
-        worksheet['B1'] = "Original Text"
-        worksheet['C1'] = "Phone Numbers"
-        
-        # Add data
-        row_num = 2
-        for table_row in range(self.results_table.rowCount()):
-            line_item = self.results_table.item(table_row, 0)
-            text_item = self.results_table.item(table_row, 1)
-            phone_item = self.results_table.item(table_row, 2)
-            
-            if line_item:
-                worksheet[f'A{row_num}'] = line_item.text()
-            if text_item:
-                worksheet[f'B{row_num}'] = text_item.text()
-            if phone_item:
-                worksheet[f'C{row_num}'] = phone_item.text()
-            
-            row_num += 1
-        
-        # Auto-adjust column widths
-        for col_idx, column in enumerate(worksheet.columns, 1):
-            max_length = 0
-            column_letter = get_column_letter(col_idx)
-            
-            for cell in column:
-                try:
-                    if cell.value and len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-            worksheet.column_dimensions[column_letter].width = adjusted_width
-        
-        # Save the workbook
-        workbook.save(file_path)
-        workbook.close()
+    def on_export_complete(self, file_name: str):
+        """Handle export completion."""
+        self._set_ui_state(UIState.IDLE)
+        QMessageBox.information(self, "Success", f"Phone numbers exported to {file_name}")
     
-    def _export_to_text(self, file_path: str):
-        """Export results to text/CSV file."""
-        with open(file_path, 'w', encoding='utf-8') as file:
-            for row in range(self.results_table.rowCount()):
-                phone_item = self.results_table.item(row, 2)
-                if phone_item:
-                    phones = phone_item.text()
-                    # Split phone numbers and write each one on a separate line
-                    phone_list = [phone.strip() for phone in phones.split(',')]
-                    for phone in phone_list:
-                        if phone:  # Only write non-empty phone numbers
-                            file.write(f"{phone}\n")
+    def on_export_error(self, error_message: str):
+        """Handle export errors."""
+        self._set_ui_state(UIState.IDLE)
+        QMessageBox.critical(self, "Error", f"Could not export results: {error_message}")
+    
+    def _set_ui_state(self, state: UIState):
+        """
+        Enable, disable and show the controls for the given state.
+        
+        Args:
+            state: UIState.IDLE, or the operation the window is busy with.
+        """
+        self._ui_state = state
+        busy = state is not UIState.IDLE
+        has_results = self.results_model.rowCount() > 0
+        
+        # Apply all changes with a single repaint
+        central_widget = self.centralWidget()
+        central_widget.setUpdatesEnabled(False)
+        try:
+            self.setCursor(Qt.CursorShape.WaitCursor if busy else Qt.CursorShape.ArrowCursor)
+            if busy:
+                self.progress_bar.setRange(0, 100)
+                self.progress_bar.setValue(0)
+                self.progress_bar.setFormat(state.value)
+            self.progress_bar.setVisible(busy)
+            
+            self.process_button.setEnabled(not busy and bool(getattr(self, 'selected_bank_prefix', None)))
+            self.file_button.setEnabled(not busy)
+            self.export_button.setEnabled(not busy and has_results)
+            self.clear_results_button.setEnabled(not busy and has_results)
+            self.cancel_button.setVisible(busy)
+        finally:
+            central_widget.setUpdatesEnabled(True)
     
     def clear_results(self):
         """Clear results table."""
-        self.results_table.setRowCount(0)
+        self._clear_results_view()
+    
+    def _clear_results_view(self):
+        """Empty the results table and summary and disable the result buttons."""
+        self.results_model.set_results([])
         self.results_summary.clear()
         self.export_button.setEnabled(False)
         self.clear_results_button.setEnabled(False)
     
     def search_banks(self):
         """Search banks by name."""
+        self._search_timer.stop()
         search_term = self.bank_search_input.text().strip()
+        # Edits that end on the term already shown need no new search
+        if search_term == self._banks_search_term:
+            return
         if not search_term:
             self.load_all_banks()
             return
         
         matches = self.extractor.search_banks(search_term)
         self.display_banks(matches)
+        self._banks_search_term = search_term
     
     def load_all_banks(self):
         """Load all banks into the table."""
-        all_banks = self.extractor.get_all_banks()
-        self.display_banks(all_banks)
+        if self._banks_search_term == "":
+            return
+        
+        # The registry does not change while the window is open
+        if self._all_banks is None:
+            self._all_banks = self.extractor.get_all_banks()
+        self.display_banks(self._all_banks)
+        self._banks_search_term = ""
     
-    def on_bank_table_double_clicked(self, item):
+    def on_bank_table_double_clicked(self, index: QModelIndex):
         """Handle double-click on bank table item."""
-        row = item.row()
-        iban_prefix_item = self.banks_table.item(row, 2)  # IBAN Prefix column
-        if iban_prefix_item:
-            iban_prefix = iban_prefix_item.text()
-            self.select_bank_from_table(iban_prefix)
+        if index.isValid():
+            self.select_bank_from_table(self.banks_model.iban_prefix(index.row()))
     
     def select_bank_from_table(self, iban_prefix):
         """Select a bank from the table and switch to extraction tab."""
-        # Find the bank in the dropdown and select it
-        found = False
-        for i in range(self.bank_combo.count()):
-            if self.bank_combo.itemData(i) == iban_prefix:
-                self.bank_combo.setCurrentIndex(i)
-                found = True
-                break
-        
-        # If found in dropdown, trigger the selection event manually
-        if found:
-            # Manually trigger the bank selection logic
-            self.on_bank_selected(self.bank_combo.currentIndex())
-        
-        # Always manually set the bank selection state to ensure it works
-        normalized_prefix = self.extractor.normalize_iban_prefix(iban_prefix)
-        bank_info = self.extractor.get_bank_info(normalized_prefix)
-        if bank_info:
-            self.selected_bank_prefix = normalized_prefix
-            self.bank_info_label.setText(
-                f"Selected: {bank_info['name']} ({bank_info['entity_code']})"
-            )
-            self.bank_info_label.setVisible(True)
-            self.process_button.setEnabled(True)
+        # Select the bank in the dropdown if it is listed there; changing the
+        # index runs on_bank_selected, so the bank is only selected directly
+        # when the index stays the same or the bank is not listed
+        index = self._bank_combo_indexes.get(iban_prefix)
+        if index is not None and index != self.bank_combo.currentIndex():
+            self.bank_combo.setCurrentIndex(index)
+        else:
+            self._select_bank(iban_prefix)
         
         # Switch to the extraction tab
         self.tab_widget.setCurrentIndex(0)
     
     def display_banks(self, banks):
         """Display banks in the table."""
-        self.banks_table.setRowCount(len(banks))
-        
-        for i, bank_data in enumerate(banks):
-            if len(bank_data) == 4:
-                iban_prefix, name, entity_code, address = bank_data
-            else:
-                iban_prefix, name = bank_data
+        rows = banks
+        if banks and len(banks[0]) != 4:
+            # Search results only carry (iban_prefix, name)
+            get_bank_info = self._get_bank_info
+            rows = []
+            for iban_prefix, name in banks:
                 entity_code = iban_prefix[2:] if len(iban_prefix) >= 6 else iban_prefix
-                bank_info = self.extractor.get_bank_info(iban_prefix)
-                address = bank_info['address'] if bank_info else ""
-            
-            # Entity code
-            entity_item = QTableWidgetItem(entity_code)
-            entity_item.setFlags(entity_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.banks_table.setItem(i, 0, entity_item)
-            
-            # Bank name
-            name_item = QTableWidgetItem(name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.banks_table.setItem(i, 1, name_item)
-            
-            # IBAN prefix
-            prefix_item = QTableWidgetItem(iban_prefix)
-            prefix_item.setFlags(prefix_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.banks_table.setItem(i, 2, prefix_item)
-            
-            # Address
-            address_item = QTableWidgetItem(address)
-            address_item.setFlags(address_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.banks_table.setItem(i, 3, address_item)
+                bank_info = get_bank_info(iban_prefix)
+                rows.append((iban_prefix, name, entity_code, bank_info['address'] if bank_info else ""))
+        self.banks_model.set_banks(rows)
 
     def cancel_operation(self):
         """Cancel the current operation (file loading or processing)."""
@@ -1197,25 +1516,23 @@ class SpanishBankGUI(QMainWindow):
         )
         if reply == QMessageBox.StandardButton.Yes:
             # Request interruption for graceful termination
-            if hasattr(self, 'file_loader') and self.file_loader.isRunning():
-                self.file_loader.requestInterruption()
-                self.file_loader.wait(5000)  # Wait for thread to finish
-            
-            if hasattr(self, 'processing_thread') and self.processing_thread.isRunning():
-                self.processing_thread.requestInterruption()
-                self.processing_thread.wait(5000)  # Wait for thread to finish
-            
-            # Restore UI state
-            self.setCursor(Qt.CursorShape.ArrowCursor)
-            self.progress_bar.setVisible(False)
-            self.process_button.setEnabled(True)
-            self.file_button.setEnabled(True)
-            self.cancel_button.setVisible(False)
+            for task in (self.file_loader, self.processing_task, self.export_task):
+                if task is not None and task.isRunning():
+                    task.requestInterruption()
+                    task.wait(5000)  # Wait for task to finish
+                    if task is self.processing_task:
+                        self._clear_results_view()
+            
+            self._set_ui_state(UIState.IDLE)
             QMessageBox.information(self, "Operation Cancelled", "Operation cancelled.")
 
 
 def main():
     """Main function to run the GUI application."""
+    # In frozen builds the process pool workers start through this entry
+    # point too; let them run their task instead of another GUI.
+    multiprocessing.freeze_support()
+    
     app = QApplication(sys.argv)
     app.setApplicationName("Spanish Bank Phone Extractor")
     app.setApplicationVersion("1.0")
@@ -1225,19 +1542,8 @@ def main():
     
     # Ensure proper color scheme handling
     palette = app.palette()
-    palette.setColor(QPalette.ColorRole.Window, QColor("#1e1e1e"))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor("#ffffff"))
-    palette.setColor(QPalette.ColorRole.Base, QColor("#2d2d30"))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor("#252526"))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor("#2d2d30"))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor("#ffffff"))
-    palette.setColor(QPalette.ColorRole.Text, QColor("#ffffff"))
-    palette.setColor(QPalette.ColorRole.Button, QColor("#3e3e42"))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor("#ffffff"))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor("#ffffff"))
-    palette.setColor(QPalette.ColorRole.Link, QColor("#0078d4"))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor("#0078d4"))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor("white"))
+    for role, color in DARK_PALETTE_COLORS:
+        palette.setColor(role, color)
     app.setPalette(palette)
     
     # Create and show the main window
@@ -0,0 +1,97 @@
+"""
+Tests for the bank registry.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from spanish_bank_extractor.core.bank_registry import BankInfo, BankRegistry
+
+_HEADER = "CÓDIGO EUROPEO,NOMBRE,DIRECCIÓN\n"
+
+
+class RegistryCacheTest(unittest.TestCase):
+    """The parsed-data cache lives in the user cache dir and follows the CSV file."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.csv_dir = os.path.join(self.directory.name, 'data')
+        self.cache_dir = os.path.join(self.directory.name, 'cache')
+        os.mkdir(self.csv_dir)
+        self.csv_file = os.path.join(self.csv_dir, 'banks.csv')
+
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.cache_dir, 'LOCALAPPDATA': self.cache_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write_csv(self, rows: str, mtime_ns: int):
+        with open(self.csv_file, 'w', encoding='utf-8') as file:
+            file.write(_HEADER + rows)
+        os.utime(self.csv_file, ns=(mtime_ns, mtime_ns))
+
+    def test_nothing_is_written_next_to_the_csv(self):
+        self._write_csv('ES0049,"Banco Santander, S.A.",Madrid\n', 1_000_000_000_000_000_000)
+        registry = BankRegistry(csv_file=self.csv_file)
+
+        self.assertEqual(os.listdir(self.csv_dir), ['banks.csv'])
+        if sys.platform != 'darwin':
+            self.assertTrue(registry.cache_file.startswith(self.cache_dir))
+        self.assertTrue(os.path.exists(registry.cache_file))
+
+    def test_replaced_csv_with_older_mtime_is_parsed_again(self):
+        self._write_csv('ES0049,"Banco Santander, S.A.",Madrid\n', 1_000_000_000_000_000_000)
+        self.assertIn('ES0049', BankRegistry(csv_file=self.csv_file))
+
+        # e.g. copied over with preserved timestamps
+        self._write_csv('ES2100,"CaixaBank, S.A.",Valencia\n', 900_000_000_000_000_000)
+        registry = BankRegistry(csv_file=self.csv_file)
+        self.assertNotIn('ES0049', registry)
+        self.assertIn('ES2100', registry)
+
+    def test_unchanged_csv_is_served_from_the_cache(self):
+        self._write_csv('ES0049,"Banco Santander, S.A.",Madrid\n', 1_000_000_000_000_000_000)
+        BankRegistry(csv_file=self.csv_file)
+
+        with mock.patch.object(BankRegistry, '_load_banks', side_effect=AssertionError("CSV parsed again")):
+            registry = BankRegistry(csv_file=self.csv_file)
+        self.assertIn('ES0049', registry)
+
+    def test_cache_is_renamed_into_place(self):
+        self._write_csv('ES0049,"Banco Santander, S.A.",Madrid\n', 1_000_000_000_000_000_000)
+        with mock.patch('os.replace', wraps=os.replace) as replace:
+            registry = BankRegistry(csv_file=self.csv_file)
+        replace.assert_called_once()
+        self.assertEqual(replace.call_args.args[1], registry.cache_file)
+        self.assertEqual(os.listdir(os.path.dirname(registry.cache_file)), [os.path.basename(registry.cache_file)])
+
+
+
+class BankEntryTest(unittest.TestCase):
+    """Registry entries are BankInfo named tuples; get_bank_info returns dicts."""
+
+    def setUp(self):
+        self.registry = BankRegistry()
+
+    def test_banks_values_are_bank_info(self):
+        bank_info = self.registry.banks['ES0049']
+        self.assertIsInstance(bank_info, BankInfo)
+        self.assertEqual(bank_info.name, 'Banco Santander, S.A.')
+        self.assertEqual(bank_info.iban_prefix, 'ES0049')
+        self.assertEqual(bank_info.entity_code, '0049')
+        with self.assertRaises(TypeError):
+            bank_info['name']
+
+    def test_get_bank_info_returns_a_dict(self):
+        bank_info = self.registry.get_bank_info('ES0049')
+        self.assertEqual(bank_info, self.registry.banks['ES0049']._asdict())
+        self.assertEqual(set(bank_info), set(BankInfo._fields))
+        self.assertIsNone(self.registry.get_bank_info('ES9999'))
+
+if __name__ == '__main__':
+    unittest.main()
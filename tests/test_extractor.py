@@ -0,0 +1,257 @@
+"""
+Tests for the phone number extractor.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from spanish_bank_extractor.core import extractor as extractor_module
+from spanish_bank_extractor.core.extractor import SpanishBankExtractor
+
+
+def _sample_lines(count: int) -> list:
+    """Build lines alternating between matching, foreign-bank and IBAN-free ones."""
+    lines = []
+    for index in range(count):
+        kind = index % 3
+        if kind == 0:
+            lines.append(f"Cliente {index}; ES91 0049 1500 0512 3456 {index % 10000:04d}; tel 612 345 67 {index % 100:02d}")
+        elif kind == 1:
+            lines.append(f"Cliente {index}; ES76 2100 0418 4502 0005 1332; tel +34 {700000000 + index}")
+        else:
+            lines.append(f"Cliente {index} sin cuenta, llamar al 687654321")
+    return lines
+
+
+_SANTANDER_IBAN = "ES91 0049 1500 0512 3456 7890"
+_CAIXABANK_IBAN = "ES76 2100 0418 4502 0005 1332"
+
+
+class PhoneMatchingTest(unittest.TestCase):
+    """Only Spanish mobile numbers, and +34 numbers not starting with 8, are extracted."""
+    
+    def setUp(self):
+        self.extractor = SpanishBankExtractor()
+    
+    def _phones(self, text: str) -> list:
+        return self.extractor.extract_phone_numbers('ES0049', f"{_SANTANDER_IBAN} {text}")
+    
+    def test_mobile_numbers_are_matched(self):
+        self.assertEqual(self._phones("tel 612345678"), ["612345678"])
+        self.assertEqual(self._phones("tel 712 345 67 89"), ["712 345 67 89"])
+    
+    def test_prefixed_numbers_are_matched(self):
+        self.assertEqual(self._phones("tel +34 912345678"), ["+34 912345678"])
+        self.assertEqual(self._phones("tel +34 91 234 56 78"), ["+34 91 234 56 78"])
+        self.assertEqual(self._phones("tel +34612345678"), ["+34612345678"])
+    
+    def test_numbers_starting_with_8_are_rejected(self):
+        self.assertEqual(self._phones("tel 812345678"), [])
+        self.assertEqual(self._phones("tel 812 345 67 89"), [])
+        self.assertEqual(self._phones("tel +34 812345678"), [])
+        self.assertEqual(self._phones("tel +34 81 234 56 78"), [])
+        self.assertEqual(
+            self._phones("tel 812345678, +34 812345678, 612345678, +34 912345678"),
+            ["612345678", "+34 912345678"]
+        )
+    
+    def test_bare_numbers_starting_with_9_are_rejected(self):
+        self.assertEqual(self._phones("tel 912345678"), [])
+    
+    def test_repeated_numbers_are_reported_once_in_order(self):
+        self.assertEqual(
+            self._phones("712345678, 612345678 y 712345678"),
+            ["712345678", "612345678"]
+        )
+        # A prefixed number is not also reported as the bare digits it contains
+        self.assertEqual(self._phones("+34 612345678"), ["+34 612345678"])
+
+
+class IbanFilterTest(unittest.TestCase):
+    """Phone numbers are only extracted from text holding an IBAN of the selected bank."""
+    
+    def setUp(self):
+        self.extractor = SpanishBankExtractor()
+    
+    def test_iban_layouts_are_recognized(self):
+        for iban in (_SANTANDER_IBAN, "ES9100491500051234567890", "ES91-0049-1500-0512-3456-7890"):
+            with self.subTest(iban=iban):
+                self.assertEqual(self.extractor.extract_phone_numbers('ES0049', f"{iban} 612345678"), ["612345678"])
+    
+    def test_prefix_formats_are_accepted(self):
+        for iban_prefix in ('ES0049', 'ES91 0049', 'ES910049'):
+            with self.subTest(iban_prefix=iban_prefix):
+                self.assertEqual(
+                    self.extractor.extract_phone_numbers(iban_prefix, f"{_SANTANDER_IBAN} 612345678"),
+                    ["612345678"]
+                )
+    
+    def test_other_banks_and_missing_ibans_are_ignored(self):
+        self.assertEqual(self.extractor.extract_phone_numbers('ES0049', f"{_CAIXABANK_IBAN} 612345678"), [])
+        self.assertEqual(self.extractor.extract_phone_numbers('ES0049', "sin cuenta 612345678"), [])
+        self.assertEqual(self.extractor.extract_phone_numbers('ES0049', "es91 0049 1500 0512 3456 7890 612345678"), [])
+        self.assertEqual(self.extractor.extract_phone_numbers('ES9999', f"{_SANTANDER_IBAN} 612345678"), [])
+    
+    def test_entity_code_outside_the_iban_does_not_match(self):
+        self.assertEqual(
+            self.extractor.extract_phone_numbers('ES0049', f"{_CAIXABANK_IBAN} ref 0049 612345678"),
+            []
+        )
+    
+    def test_multi_bank_extraction(self):
+        self.assertEqual(
+            self.extractor.extract_phone_numbers_multi(f"{_SANTANDER_IBAN} {_CAIXABANK_IBAN} 612345678"),
+            {'ES0049': ["612345678"], 'ES2100': ["612345678"]}
+        )
+        self.assertEqual(self.extractor.extract_phone_numbers_multi(f"{_SANTANDER_IBAN} sin teléfono"), {})
+
+
+class ProcessTextTest(unittest.TestCase):
+    """process_text reports matching lines with their 1-based line numbers."""
+    
+    def test_line_numbers_and_text(self):
+        text = "\n".join([
+            "cabecera",
+            "",
+            f"{_SANTANDER_IBAN} 612345678",
+            f"{_CAIXABANK_IBAN} 712345678",
+            f"  {_SANTANDER_IBAN} tel 712345678, +34 912345678  ",
+            "612345678",
+        ])
+        results = SpanishBankExtractor().process_text('ES0049', text)
+        self.assertEqual(results, [
+            {
+                'line_number': 3,
+                'text': f"{_SANTANDER_IBAN} 612345678",
+                'phone_numbers': ["612345678"],
+                'phone_count': 1,
+            },
+            {
+                'line_number': 5,
+                'text': f"{_SANTANDER_IBAN} tel 712345678, +34 912345678",
+                'phone_numbers': ["712345678", "+34 912345678"],
+                'phone_count': 2,
+            },
+        ])
+    
+    def test_large_file_scan_matches_process_text(self):
+        text = '\n'.join(_sample_lines(3000)) + '\n'
+        extractor = SpanishBankExtractor()
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as file:
+            file.write(text)
+        try:
+            self.assertEqual(
+                extractor.process_large_file('ES0049', file.name, chunk_size=100),
+                extractor.process_text('ES0049', text)
+            )
+        finally:
+            os.remove(file.name)
+
+    
+    def test_large_file_scan_splits_lines_at_carriage_returns(self):
+        lines = _sample_lines(300)
+        # Old Mac line endings, mixed with CRLF and LF ones as in merged exports
+        text = '\r'.join(lines[:100]) + '\r' + '\r\n'.join(lines[100:200]) + '\r\n' + '\n'.join(lines[200:])
+        extractor = SpanishBankExtractor()
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as file:
+            file.write(text.encode('utf-8'))
+        try:
+            results = extractor.process_large_file('ES0049', file.name, chunk_size=7)
+        finally:
+            os.remove(file.name)
+        
+        self.assertEqual(results, extractor.process_text('ES0049', '\n'.join(lines)))
+        self.assertEqual([result['line_number'] for result in results[:3]], [1, 4, 7])
+
+
+class BankSearchTest(unittest.TestCase):
+    """Bank searches match names case-insensitively."""
+    
+    def test_search(self):
+        extractor = SpanishBankExtractor()
+        matches = extractor.search_banks('SANTANDER')
+        self.assertIn(('ES0049', 'Banco Santander, S.A.'), matches)
+        self.assertTrue(all('santander' in name.lower() for _, name in matches))
+        self.assertEqual(extractor.search_banks('s'), [])
+        self.assertEqual(extractor.search_banks('no existe ningún banco así'), [])
+
+
+class UnicodeMatchingTest(unittest.TestCase):
+    """Phone numbers are matched with Unicode-aware whitespace and word boundaries."""
+    
+    def setUp(self):
+        self.extractor = SpanishBankExtractor()
+    
+    def _phones(self, text: str) -> list:
+        return self.extractor.extract_phone_numbers('ES0049', f"{_SANTANDER_IBAN} {text}")
+    
+    def test_no_break_space_groups_are_matched(self):
+        self.assertEqual(self._phones("tel 612\xa0345\xa067\xa089"), ["612\xa0345\xa067\xa089"])
+        self.assertEqual(self._phones("tel +34\xa091\xa0234\xa056\xa078"), ["+34\xa091\xa0234\xa056\xa078"])
+    
+    def test_number_glued_to_a_letter_is_rejected(self):
+        self.assertEqual(self._phones("ñ612345678"), [])
+        self.assertEqual(self._phones("é712345678 y 612345678"), ["612345678"])
+
+
+class LargeFileCancellationTest(unittest.TestCase):
+    """Aborting process_large_file from its progress callback must return promptly."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.extractor = SpanishBankExtractor()
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as file:
+            file.write('\n'.join(_sample_lines(300000)) + '\n')
+            cls.file_path = file.name
+    
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.file_path)
+    
+    def _assert_cancels_promptly(self, max_workers: int):
+        started = time.perf_counter()
+        results = self.extractor.process_large_file('ES0049', self.file_path, max_workers=max_workers)
+        full_duration = time.perf_counter() - started
+        self.assertEqual(len(results), 100000)
+        
+        def cancel(percent, bytes_processed, total_bytes):
+            raise InterruptedError("Processing cancelled")
+        
+        started = time.perf_counter()
+        with self.assertRaises(RuntimeError):
+            self.extractor.process_large_file(
+                'ES0049', self.file_path, progress_callback=cancel, max_workers=max_workers
+            )
+        self.assertLess(time.perf_counter() - started, full_duration / 2)
+    
+    def test_serial_scan_cancels_promptly(self):
+        self._assert_cancels_promptly(max_workers=1)
+    
+    def test_parallel_scan_cancels_promptly(self):
+        with mock.patch.object(extractor_module, '_PARALLEL_MIN_SIZE', 0):
+            self._assert_cancels_promptly(max_workers=2)
+    
+    def test_shared_executor_is_reused_and_left_running(self):
+        expected = self.extractor.process_large_file('ES0049', self.file_path)
+        executor = ProcessPoolExecutor(max_workers=2, mp_context=extractor_module._POOL_CONTEXT)
+        try:
+            with mock.patch.object(extractor_module, '_PARALLEL_MIN_SIZE', 0), \
+                    mock.patch.object(extractor_module, 'ProcessPoolExecutor', side_effect=AssertionError("new pool")):
+                for _ in range(2):
+                    self.assertEqual(
+                        self.extractor.process_large_file('ES0049', self.file_path, executor=executor),
+                        expected
+                    )
+        finally:
+            executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for the GUI background tasks.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from spanish_bank_extractor.gui import app
+
+
+class EncodingDetectionTest(unittest.TestCase):
+    """The encoding sample of a text file must not misread valid UTF-8."""
+
+    def setUp(self):
+        self.file_path = None
+
+    def tearDown(self):
+        if self.file_path:
+            os.remove(self.file_path)
+
+    def _write(self, data: bytes) -> str:
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as file:
+            file.write(data)
+            self.file_path = file.name
+        return self.file_path
+
+    def test_sample_ending_inside_a_character_without_newlines(self):
+        # 'ñ' is two bytes; the odd prefix puts one of them at each side of
+        # the sample boundary.
+        data = b'a' + 'ñ'.encode('utf-8') * app.ENCODING_SAMPLE_SIZE
+        self.assertEqual(data[app.ENCODING_SAMPLE_SIZE - 1:app.ENCODING_SAMPLE_SIZE], b'\xc3')
+        task = app.FileLoaderTask(self._write(data), '.txt')
+
+        self.assertEqual(task._detect_encoding(), 'utf-8-sig')
+        self.assertEqual(task._read_text_file(), data.decode('utf-8'))
+
+    def test_invalid_utf8_is_not_detected_as_utf8(self):
+        task = app.FileLoaderTask(self._write('España\n'.encode('cp1252')), '.txt')
+        self.assertNotEqual(task._detect_encoding(), 'utf-8-sig')
+
+
+class ExcelExportTest(unittest.TestCase):
+    """Excel exports stream every result, past the rows used to size the columns."""
+
+    def test_rows_beyond_the_width_sample_are_written(self):
+        import openpyxl
+
+        count = app.EXCEL_WIDTH_SAMPLE_ROWS + 10
+        results = [
+            {'line_number': index + 1, 'text': f"linea {index}", 'phone_numbers': ['612345678', '+34 712345678']}
+            for index in range(count)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'export.xlsx')
+            app.ExportTask(results, file_path).execute()
+
+            workbook = openpyxl.load_workbook(file_path, read_only=True)
+            rows = list(workbook.active.iter_rows(values_only=True))
+            workbook.close()
+
+        self.assertEqual(len(rows), count + 1)
+        self.assertEqual(rows[0], ("Line Number", "Original Text", "Phone Numbers"))
+        self.assertEqual(rows[-1], (str(count), f"linea {count - 1}", '612345678, +34 712345678'))
+
+
+class ResultsModelTest(unittest.TestCase):
+    """The results model serves cells straight from the result dictionaries."""
+
+    def test_display_data(self):
+        model = app.ResultsModel()
+        model.set_results([{'line_number': 42, 'text': "linea", 'phone_numbers': ['612345678', '712345678']}])
+        self.assertEqual(model.data(model.index(0, 0)), 42)
+        self.assertEqual(model.data(model.index(0, 1)), "linea")
+        self.assertEqual(model.data(model.index(0, 2)), "612345678, 712345678")
+
+
+if __name__ == '__main__':
+    unittest.main()